@@ -18,14 +18,17 @@
 # ------------------------------------------------------------------------------
 """This module contains the protocol generator."""
 
+import functools
 import itertools
 import logging
 import os
 import re
+import subprocess  # nosec
 from datetime import date
 from os import path
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from string import Template
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
 
 from aea.configurations.base import (
     ProtocolSpecification,
@@ -44,6 +47,7 @@ CUSTOM_TYPES_DOT_PY_FILE_NAME = "custom_types.py"
 SERIALIZATION_DOT_PY_FILE_NAME = "serialization.py"
 
 CUSTOM_TYPE_PATTERN = "ct:[A-Z][a-zA-Z0-9]*"
+CAMEL_CASE_BOUNDARY_REGEX = re.compile(r"(?<!^)(?=[A-Z])")
 SPECIFICATION_PRIMITIVE_TYPES = ["pt:bytes", "pt:int", "pt:float", "pt:bool", "pt:str"]
 PYTHON_PRIMITIVE_TYPES = [
     "bytes",
@@ -71,7 +75,90 @@ PYTHON_TYPE_TO_PROTO_TYPE = {
     "bool": "bool",
     "str": "string",
 }
+PYTHON_TYPES_WITH_PROTO_TYPE = frozenset(PYTHON_TYPE_TO_PROTO_TYPE)
+SINGLE_SUB_TYPE_PREFIXES = frozenset(
+    {"Optional", "pt:optional", "FrozenSet", "pt:set", "pt:list"}
+)
+MULTIPLE_SUB_TYPES_PREFIXES = frozenset({"Dict", "pt:dict", "Union", "pt:union"})
 RESERVED_NAMES = {"body", "message_id", "dialogue_reference", "target", "performative"}
+INDENT_STR = "    "
+MAX_INDENT_LEVEL = 64
+INDENTS = tuple(INDENT_STR * level for level in range(MAX_INDENT_LEVEL + 1))
+COPYRIGHT_HEADER_START = (
+    "# -*- coding: utf-8 -*-\n"
+    "# ------------------------------------------------------------------------------\n"
+    "#\n"
+)
+COPYRIGHT_HEADER_END = (
+    "#\n"
+    '#   Licensed under the Apache License, Version 2.0 (the "License");\n'
+    "#   you may not use this file except in compliance with the License.\n"
+    "#   You may obtain a copy of the License at\n"
+    "#\n"
+    "#       http://www.apache.org/licenses/LICENSE-2.0\n"
+    "#\n"
+    "#   Unless required by applicable law or agreed to in writing, software\n"
+    '#   distributed under the License is distributed on an "AS IS" BASIS,\n'
+    "#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.\n"
+    "#   See the License for the specific language governing permissions and\n"
+    "#   limitations under the License.\n"
+    "#\n"
+    "# ------------------------------------------------------------------------------\n"
+)
+CUSTOM_TYPE_IMPORT_TEMPLATE = "from {path_to_protocol_package}.custom_types import {custom_type} as Custom{custom_type}"
+# python container type prefix --> built-in type checked in unions
+UNION_CONTAINER_TYPES = {"FrozenSet": "frozenset", "Tuple": "tuple", "Dict": "dict"}
+
+# assertions emitted into the generated _is_consistent method
+CONTENT_TYPE_ASSERTION_TEMPLATE = Template(
+    'assert type($variable) is $python_type, INVALID_CONTENT_TYPE_MSG.format("$name", "$expected", type($variable))'
+)
+ELEMENTS_ASSERTION_MESSAGE_TEMPLATE = Template(
+    "), \"Invalid type for $container elements in content '$name'. Expected '$expected'.\""
+)
+DICT_ASSERTION_MESSAGE_TEMPLATE = Template(
+    "), \"Invalid type for dictionary ${part}s in content '$name'. Expected '$expected'. Found '{}'.\".format(type(${part}_of_$name))"
+)
+
+# methods of the generated Dialogues class, at class body indentation
+DIALOGUES_METHODS_TEMPLATE = Template(
+    '''    def __init__(self, agent_address: Address) -> None:
+        """
+        Initialize dialogues.
+
+        :param agent_address: the address of the agent for whom dialogues are maintained
+        :return: None
+        """
+        Dialogues.__init__(self, agent_address=agent_address)
+        self._dialogue_stats = ${dialogue_class}Stats()
+
+    @property
+    def dialogue_stats(self) -> ${dialogue_class}Stats:
+        """
+        Get the dialogue statistics.
+
+        :return: dialogue stats object
+        """
+        return self._dialogue_stats
+
+    def create_dialogue(
+        self, dialogue_label: DialogueLabel, role: Dialogue.Role,
+    ) -> $dialogue_class:
+        """
+        Create an instance of fipa dialogue.
+
+        :param dialogue_label: the identifier of the dialogue
+        :param role: the role of the agent this dialogue is maintained for
+
+        :return: the created dialogue
+        """
+        dialogue = $dialogue_class(
+            dialogue_label=dialogue_label, agent_address=self.agent_address, role=role
+        )
+        return dialogue
+
+'''
+)
 
 logger = logging.getLogger(__name__)
 
@@ -83,27 +170,20 @@ def _copyright_header_str(author: str) -> str:
     :param author: the author of the protocol.
     :return: The copyright header text.
     """
+    return _copyright_header_str_for_year(author, date.today().year)
+
+
+@functools.lru_cache(maxsize=16)
+def _copyright_header_str_for_year(author: str, year: int) -> str:
+    """
+    Produce the copyright header text for a protocol and a given year.
+
+    :param author: the author of the protocol.
+    :param year: the copyright year.
+    :return: The copyright header text.
+    """
     copy_right_str = (
-        "# -*- coding: utf-8 -*-\n"
-        "# ------------------------------------------------------------------------------\n"
-        "#\n"
-    )
-    copy_right_str += "#   Copyright {} {}\n".format(date.today().year, author)
-    copy_right_str += (
-        "#\n"
-        '#   Licensed under the Apache License, Version 2.0 (the "License");\n'
-        "#   you may not use this file except in compliance with the License.\n"
-        "#   You may obtain a copy of the License at\n"
-        "#\n"
-        "#       http://www.apache.org/licenses/LICENSE-2.0\n"
-        "#\n"
-        "#   Unless required by applicable law or agreed to in writing, software\n"
-        '#   distributed under the License is distributed on an "AS IS" BASIS,\n'
-        "#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.\n"
-        "#   See the License for the specific language governing permissions and\n"
-        "#   limitations under the License.\n"
-        "#\n"
-        "# ------------------------------------------------------------------------------\n"
+        f"{COPYRIGHT_HEADER_START}#   Copyright {year} {author}\n{COPYRIGHT_HEADER_END}"
     )
     return copy_right_str
 
@@ -115,9 +195,10 @@ def _to_camel_case(text: str) -> str:
     :param text: the text to be converted.
     :return: The text in CamelCase format.
     """
-    return "".join(word.title() for word in text.split("_"))
+    return text.replace("_", " ").title().replace(" ", "")
 
 
+@functools.lru_cache(maxsize=None)
 def _camel_case_to_snake_case(text: str) -> str:
     """
     Convert a text in CamelCase format into the snake_case format
@@ -125,7 +206,17 @@ def _camel_case_to_snake_case(text: str) -> str:
     :param text: the text to be converted.
     :return: The text in CamelCase format.
     """
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", text).lower()
+    return CAMEL_CASE_BOUNDARY_REGEX.sub("_", text).lower()
+
+
+def _get_type_prefix(content_type: str) -> str:
+    """
+    Extract the prefix of a type, i.e. everything before its opening bracket.
+
+    :param content_type: a specification or python type (e.g. pt:set[pt:int], Dict[str, int]).
+    :return: the prefix of the type (e.g. pt:set, Dict).
+    """
+    return content_type.partition("[")[0]
 
 
 def _is_composition_type_with_custom_type(content_type: str) -> bool:
@@ -135,31 +226,56 @@ def _is_composition_type_with_custom_type(content_type: str) -> bool:
     :param: the content type
     :return: Boolean result
     """
-    if content_type.startswith("Optional"):
+    type_prefix = _get_type_prefix(content_type)
+    if type_prefix == "Optional":
         sub_type = _get_sub_types_of_compositional_types(content_type)[0]
         result = _is_composition_type_with_custom_type(sub_type)
-    elif content_type.startswith("Union"):
-        sub_types = _get_sub_types_of_compositional_types(content_type)
-        result = False
-        for sub_type in sub_types:
-            if _is_composition_type_with_custom_type(sub_type):
-                result = True
-                break
-    elif content_type.startswith("Dict"):
-        sub_type_1 = _get_sub_types_of_compositional_types(content_type)[0]
-        sub_type_2 = _get_sub_types_of_compositional_types(content_type)[1]
-
-        result = (sub_type_1 not in PYTHON_TYPE_TO_PROTO_TYPE.keys()) or (
-            sub_type_2 not in PYTHON_TYPE_TO_PROTO_TYPE.keys()
-        )
-    elif content_type.startswith("FrozenSet") or content_type.startswith("Tuple"):
+    elif type_prefix == "Union":
+        result = any(
+            _is_composition_type_with_custom_type(sub_type)
+            for sub_type in _get_sub_types_of_compositional_types(content_type)
+        )
+    elif type_prefix == "Dict":
+        sub_type_1, sub_type_2 = _get_sub_types_of_compositional_types(content_type)
+
+        result = (sub_type_1 not in PYTHON_TYPES_WITH_PROTO_TYPE) or (
+            sub_type_2 not in PYTHON_TYPES_WITH_PROTO_TYPE
+        )
+    elif type_prefix in ("FrozenSet", "Tuple"):
         sub_type = _get_sub_types_of_compositional_types(content_type)[0]
-        result = sub_type not in PYTHON_TYPE_TO_PROTO_TYPE.keys()
+        result = sub_type not in PYTHON_TYPES_WITH_PROTO_TYPE
     else:
         result = False
     return result
 
 
+def _split_top_level_sub_types(inside_brackets: str) -> List[str]:
+    """
+    Split the content of a compositional type's brackets into its sub-types.
+
+    Only commas which are not enclosed in brackets separate sub-types, so nested compositional sub-types are kept whole.
+
+    :param inside_brackets: the text between the outermost brackets of a compositional type.
+    :return: list of the (stripped) sub-types.
+    """
+    sub_types = []
+    depth = 0
+    sub_type_start = 0
+    for index, character in enumerate(inside_brackets):
+        if character == "[":
+            depth += 1
+        elif character == "]":
+            depth -= 1
+        elif character == "," and depth == 0:
+            sub_types.append(inside_brackets[sub_type_start:index].strip())
+            sub_type_start = index + 1
+    last_sub_type = inside_brackets[sub_type_start:].strip()
+    if last_sub_type != "":
+        sub_types.append(last_sub_type)
+    return sub_types
+
+
+@functools.lru_cache(maxsize=None)
 def _get_sub_types_of_compositional_types(compositional_type: str) -> tuple:
     """
     Extract the sub-types of compositional types.
@@ -170,81 +286,17 @@ def _get_sub_types_of_compositional_types(compositional_type: str) -> tuple:
     :return: tuple containing all extracted sub-types.
     """
     sub_types_list = list()
-    if compositional_type.startswith("Optional") or compositional_type.startswith(
-        "pt:optional"
-    ):
-        sub_type1 = compositional_type[
-            compositional_type.index("[") + 1 : compositional_type.rindex("]")
-        ].strip()
-        sub_types_list.append(sub_type1)
-    if (
-        compositional_type.startswith("FrozenSet")
-        or compositional_type.startswith("pt:set")
-        or compositional_type.startswith("pt:list")
-    ):
-        sub_type1 = compositional_type[
-            compositional_type.index("[") + 1 : compositional_type.rindex("]")
-        ].strip()
-        sub_types_list.append(sub_type1)
-    if compositional_type.startswith("Tuple"):
-        sub_type1 = compositional_type[
-            compositional_type.index("[") + 1 : compositional_type.rindex("]")
-        ].strip()
-        sub_type1 = sub_type1[:-5]
-        sub_types_list.append(sub_type1)
-    if compositional_type.startswith("Dict") or compositional_type.startswith(
-        "pt:dict"
-    ):
-        sub_type1 = compositional_type[
-            compositional_type.index("[") + 1 : compositional_type.index(",")
-        ].strip()
-        sub_type2 = compositional_type[
-            compositional_type.index(",") + 1 : compositional_type.rindex("]")
-        ].strip()
-        sub_types_list.extend([sub_type1, sub_type2])
-    if compositional_type.startswith("Union") or compositional_type.startswith(
-        "pt:union"
-    ):
-        inside_union = compositional_type[
-            compositional_type.index("[") + 1 : compositional_type.rindex("]")
-        ].strip()
-        while inside_union != "":
-            if inside_union.startswith("Dict") or inside_union.startswith("pt:dict"):
-                sub_type = inside_union[: inside_union.index("]") + 1].strip()
-                rest_of_inside_union = inside_union[
-                    inside_union.index("]") + 1 :
-                ].strip()
-                if rest_of_inside_union.find(",") == -1:
-                    # it is the last sub-type
-                    inside_union = rest_of_inside_union.strip()
-                else:
-                    # it is not the last sub-type
-                    inside_union = rest_of_inside_union[
-                        rest_of_inside_union.index(",") + 1 :
-                    ].strip()
-            elif inside_union.startswith("Tuple"):
-                sub_type = inside_union[: inside_union.index("]") + 1].strip()
-                rest_of_inside_union = inside_union[
-                    inside_union.index("]") + 1 :
-                ].strip()
-                if rest_of_inside_union.find(",") == -1:
-                    # it is the last sub-type
-                    inside_union = rest_of_inside_union.strip()
-                else:
-                    # it is not the last sub-type
-                    inside_union = rest_of_inside_union[
-                        rest_of_inside_union.index(",") + 1 :
-                    ].strip()
-            else:
-                if inside_union.find(",") == -1:
-                    # it is the last sub-type
-                    sub_type = inside_union.strip()
-                    inside_union = ""
-                else:
-                    # it is not the last sub-type
-                    sub_type = inside_union[: inside_union.index(",")].strip()
-                    inside_union = inside_union[inside_union.index(",") + 1 :].strip()
-            sub_types_list.append(sub_type)
+    inside_brackets = compositional_type[
+        compositional_type.find("[") + 1 : compositional_type.rfind("]")
+    ].strip()
+    type_prefix = _get_type_prefix(compositional_type)
+    if type_prefix in SINGLE_SUB_TYPE_PREFIXES:
+        sub_types_list.append(inside_brackets)
+    elif type_prefix == "Tuple":
+        # drop the trailing ', ...'
+        sub_types_list.append(inside_brackets[:-5])
+    elif type_prefix in MULTIPLE_SUB_TYPES_PREFIXES:
+        sub_types_list.extend(_split_top_level_sub_types(inside_brackets))
     return tuple(sub_types_list)
 
 
@@ -280,9 +332,9 @@ def _pct_specification_type_to_python_type(specification_type: str) -> str:
     element_type = _get_sub_types_of_compositional_types(specification_type)[0]
     element_type_in_python = _specification_type_to_python_type(element_type)
     if specification_type.startswith("pt:set"):
-        python_type = "FrozenSet[{}]".format(element_type_in_python)
+        python_type = f"FrozenSet[{element_type_in_python}]"
     else:
-        python_type = "Tuple[{}, ...]".format(element_type_in_python)
+        python_type = f"Tuple[{element_type_in_python}, ...]"
     return python_type
 
 
@@ -296,9 +348,7 @@ def _pmt_specification_type_to_python_type(specification_type: str) -> str:
     element_types = _get_sub_types_of_compositional_types(specification_type)
     element1_type_in_python = _specification_type_to_python_type(element_types[0])
     element2_type_in_python = _specification_type_to_python_type(element_types[1])
-    python_type = "Dict[{}, {}]".format(
-        element1_type_in_python, element2_type_in_python
-    )
+    python_type = f"Dict[{element1_type_in_python}, {element2_type_in_python}]"
     return python_type
 
 
@@ -310,11 +360,10 @@ def _mt_specification_type_to_python_type(specification_type: str) -> str:
     :return: The equivalent data type in Python
     """
     sub_types = _get_sub_types_of_compositional_types(specification_type)
-    python_type = "Union["
-    for sub_type in sub_types:
-        python_type += "{}, ".format(_specification_type_to_python_type(sub_type))
-    python_type = python_type[:-2]
-    python_type += "]"
+    python_sub_types = ", ".join(
+        _specification_type_to_python_type(sub_type) for sub_type in sub_types
+    )
+    python_type = f"Union[{python_sub_types}]"
     return python_type
 
 
@@ -327,10 +376,19 @@ def _optional_specification_type_to_python_type(specification_type: str) -> str:
     """
     element_type = _get_sub_types_of_compositional_types(specification_type)[0]
     element_type_in_python = _specification_type_to_python_type(element_type)
-    python_type = "Optional[{}]".format(element_type_in_python)
+    python_type = f"Optional[{element_type_in_python}]"
     return python_type
 
 
+COMPOSITIONAL_SPECIFICATION_TYPE_CONVERTERS = {
+    "pt:optional": _optional_specification_type_to_python_type,
+    "pt:union": _mt_specification_type_to_python_type,
+    "pt:set": _pct_specification_type_to_python_type,
+    "pt:list": _pct_specification_type_to_python_type,
+    "pt:dict": _pmt_specification_type_to_python_type,
+}
+
+
 def _specification_type_to_python_type(specification_type: str) -> str:
     """
     Convert a data type in protocol specification into its Python equivalent.
@@ -338,27 +396,23 @@ def _specification_type_to_python_type(specification_type: str) -> str:
     :param specification_type: a protocol specification data type
     :return: The equivalent data type in Python
     """
-    if specification_type.startswith("pt:optional"):
-        python_type = _optional_specification_type_to_python_type(specification_type)
-    elif specification_type.startswith("pt:union"):
-        python_type = _mt_specification_type_to_python_type(specification_type)
-    elif specification_type.startswith("ct:"):
+    if specification_type.startswith("ct:"):
         python_type = _ct_specification_type_to_python_type(specification_type)
     elif specification_type in SPECIFICATION_PRIMITIVE_TYPES:
         python_type = _pt_specification_type_to_python_type(specification_type)
-    elif specification_type.startswith("pt:set"):
-        python_type = _pct_specification_type_to_python_type(specification_type)
-    elif specification_type.startswith("pt:list"):
-        python_type = _pct_specification_type_to_python_type(specification_type)
-    elif specification_type.startswith("pt:dict"):
-        python_type = _pmt_specification_type_to_python_type(specification_type)
     else:
-        raise ProtocolSpecificationParseError(
-            "Unsupported type: '{}'".format(specification_type)
+        converter = COMPOSITIONAL_SPECIFICATION_TYPE_CONVERTERS.get(
+            _get_type_prefix(specification_type)
         )
+        if converter is None:
+            raise ProtocolSpecificationParseError(
+                "Unsupported type: '{}'".format(specification_type)
+            )
+        python_type = converter(specification_type)
     return python_type
 
 
+@functools.lru_cache(maxsize=None)
 def _union_sub_type_to_protobuf_variable_name(
     content_name: str, content_type: str
 ) -> str:
@@ -369,20 +423,20 @@ def _union_sub_type_to_protobuf_variable_name(
     :param content_type: the sub-type of a union type
     :return: The variable name
     """
-    if content_type.startswith("FrozenSet"):
+    type_prefix = _get_type_prefix(content_type)
+    if type_prefix == "FrozenSet":
         sub_type = _get_sub_types_of_compositional_types(content_type)[0]
-        expanded_type_str = "set_of_{}".format(sub_type)
-    elif content_type.startswith("Tuple"):
+        expanded_type_str = f"set_of_{sub_type}"
+    elif type_prefix == "Tuple":
         sub_type = _get_sub_types_of_compositional_types(content_type)[0]
-        expanded_type_str = "list_of_{}".format(sub_type)
-    elif content_type.startswith("Dict"):
-        sub_type_1 = _get_sub_types_of_compositional_types(content_type)[0]
-        sub_type_2 = _get_sub_types_of_compositional_types(content_type)[1]
-        expanded_type_str = "dict_of_{}_{}".format(sub_type_1, sub_type_2)
+        expanded_type_str = f"list_of_{sub_type}"
+    elif type_prefix == "Dict":
+        sub_type_1, sub_type_2 = _get_sub_types_of_compositional_types(content_type)
+        expanded_type_str = f"dict_of_{sub_type_1}_{sub_type_2}"
     else:
         expanded_type_str = content_type
 
-    protobuf_variable_name = "{}_type_{}".format(content_name, expanded_type_str)
+    protobuf_variable_name = f"{content_name}_type_{expanded_type_str}"
 
     return protobuf_variable_name
 
@@ -394,10 +448,7 @@ def _python_pt_or_ct_type_to_proto_type(content_type: str) -> str:
     :param content_type: the python type
     :return: The protobuf equivalent
     """
-    if content_type in PYTHON_TYPE_TO_PROTO_TYPE.keys():
-        proto_type = PYTHON_TYPE_TO_PROTO_TYPE[content_type]
-    else:
-        proto_type = content_type
+    proto_type = PYTHON_TYPE_TO_PROTO_TYPE.get(content_type, content_type)
     return proto_type
 
 
@@ -405,26 +456,24 @@ def _is_valid_content_name(content_name: str) -> bool:
     return content_name not in RESERVED_NAMES
 
 
+@functools.lru_cache(maxsize=None)
 def _includes_custom_type(content_type: str) -> bool:
     """
     Evaluate whether a content type is a custom type or has a custom type as a sub-type.
     :return: Boolean result
     """
-    if content_type.startswith("Optional"):
+    type_prefix = _get_type_prefix(content_type)
+    if type_prefix == "Optional":
         sub_type = _get_sub_types_of_compositional_types(content_type)[0]
         result = _includes_custom_type(sub_type)
-    elif content_type.startswith("Union"):
-        sub_types = _get_sub_types_of_compositional_types(content_type)
-        result = False
-        for sub_type in sub_types:
-            if _includes_custom_type(sub_type):
-                result = True
-                break
+    elif type_prefix == "Union":
+        result = any(
+            _includes_custom_type(sub_type)
+            for sub_type in _get_sub_types_of_compositional_types(content_type)
+        )
     elif (
-        content_type.startswith("FrozenSet")
-        or content_type.startswith("Tuple")
-        or content_type.startswith("Dict")
-        or content_type in PYTHON_TYPE_TO_PROTO_TYPE.keys()
+        type_prefix in ("FrozenSet", "Tuple", "Dict")
+        or content_type in PYTHON_TYPES_WITH_PROTO_TYPE
     ):
         result = False
     else:
@@ -432,6 +481,216 @@ def _includes_custom_type(content_type: str) -> bool:
     return result
 
 
+class IndentWriter:
+    """Accumulate generated code line by line, keeping track of the indentation level."""
+
+    def __init__(self) -> None:
+        """Instantiate an empty writer at indentation level 0."""
+        self._parts = []  # type: List[str]
+        self._level = 0
+
+    def indent(self, number: int = 1) -> None:
+        """
+        Increase the indentation level.
+
+        :param number: the number of indentation levels to add
+        :return: None
+        """
+        new_level = self._level + number
+        if new_level > MAX_INDENT_LEVEL:
+            raise ValueError(
+                "Error: indentation level exceeds {}.".format(MAX_INDENT_LEVEL)
+            )
+        self._level = new_level
+
+    def dedent(self, number: int = 1) -> None:
+        """
+        Decrease the indentation level.
+
+        :param number: the number of indentation levels to remove
+        :return: None
+        """
+        new_level = self._level - number
+        if new_level < 0:
+            raise ValueError("Not enough spaces in the 'indent' variable to remove.")
+        self._level = new_level
+
+    def write(self, line: str = "") -> None:
+        """
+        Write a line at the current indentation level.
+
+        Empty lines are written without indentation.
+
+        :param line: the line without indentation and line break
+        :return: None
+        """
+        if line:
+            self._parts.append(INDENTS[self._level])
+            self._parts.append(line)
+        self._parts.append("\n")
+
+    def write_raw(self, text: str) -> None:
+        """
+        Write a piece of text as it is, without indentation or line break.
+
+        :param text: the text
+        :return: None
+        """
+        self._parts.append(text)
+
+    def getvalue(self) -> str:
+        """Get the code written so far."""
+        return "".join(self._parts)
+
+    def write_to(self, file: TextIO) -> None:
+        """
+        Write the code written so far to a file, without joining it into a single string first.
+
+        :param file: the file object
+        :return: None
+        """
+        file.writelines(self._parts)
+
+
+def _write_property(
+    writer: IndentWriter, name: str, return_type: str, docstring: str
+) -> None:
+    """
+    Write a read-only property which returns the private attribute of the same name.
+
+    :param writer: the writer to emit the property into
+    :param name: the name of the property, i.e. the private attribute without its leading underscore
+    :param return_type: the return type of the property
+    :param docstring: the docstring of the property; multi-line docstrings are written with the quotes on their own lines
+    :return: None
+    """
+    writer.write("@property")
+    writer.write(f"def {name}(self) -> {return_type}:")
+    writer.indent()
+    if "\n" in docstring:
+        writer.write('"""')
+        for line in docstring.split("\n"):
+            writer.write(line)
+        writer.write('"""')
+    else:
+        writer.write(f'"""{docstring}"""')
+    writer.write(f"return self._{name}")
+    writer.write()
+    writer.dedent()
+
+
+def _custom_types_module_str(author: str, custom_types: Tuple[str, ...]) -> str:
+    """
+    Produce the contents of the custom_types module of a protocol.
+
+    :param author: the author of the protocol
+    :param custom_types: the custom types of the protocol, in order of appearance
+    :return: the custom_types.py file content
+    """
+    writer = IndentWriter()
+
+    # Header
+    writer.write_raw(_copyright_header_str(author))
+    writer.write()
+
+    writer.write_raw(_custom_types_module_body_str(custom_types))
+    return writer.getvalue()
+
+
+@functools.lru_cache(maxsize=128)
+def _custom_types_module_body_str(custom_types: Tuple[str, ...]) -> str:
+    """
+    Produce the custom_types module of a protocol, without its copyright header.
+
+    The output only depends on the custom types, so it is cached across generator runs;
+    the header carries the current year and is prepended on every call instead.
+
+    :param custom_types: the custom types of the protocol, in order of appearance
+    :return: the custom_types.py file content after the copyright header
+    """
+    writer = IndentWriter()
+
+    # Module docstring
+    writer.write(
+        '"""This module contains class representations corresponding to every custom type in the protocol specification."""'
+    )
+
+    if len(custom_types) == 0:
+        return writer.getvalue()
+
+    # class code per custom type
+    for custom_type in custom_types:
+        snake_case_custom_type = _camel_case_to_snake_case(custom_type)
+        writer.write()
+        writer.write()
+        writer.write(f"class {custom_type}:")
+        writer.indent()
+        writer.write(f'"""This class represents an instance of {custom_type}."""')
+        writer.write()
+        writer.write("def __init__(self):")
+        writer.indent()
+        writer.write(f'"""Initialise an instance of {custom_type}."""')
+        writer.write("raise NotImplementedError")
+        writer.write()
+        writer.dedent()
+        writer.write("@staticmethod")
+        writer.write(
+            f'def encode({snake_case_custom_type}_protobuf_object, {snake_case_custom_type}_object: "{custom_type}") -> None:'
+        )
+        writer.indent()
+        writer.write('"""')
+        writer.write(
+            "Encode an instance of this class into the protocol buffer object."
+        )
+        writer.write()
+        writer.write(
+            f"The protocol buffer object in the {snake_case_custom_type}_protobuf_object argument must be matched with the instance of this class in the '{snake_case_custom_type}_object' argument."
+        )
+        writer.write()
+        writer.write(
+            f":param {snake_case_custom_type}_protobuf_object: the protocol buffer object whose type corresponds with this class."
+        )
+        writer.write(
+            f":param {snake_case_custom_type}_object: an instance of this class to be encoded in the protocol buffer object."
+        )
+        writer.write(":return: None")
+        writer.write('"""')
+        writer.write("raise NotImplementedError")
+        writer.write()
+        writer.dedent()
+
+        writer.write("@classmethod")
+        writer.write(
+            f'def decode(cls, {snake_case_custom_type}_protobuf_object) -> "{custom_type}":'
+        )
+        writer.indent()
+        writer.write('"""')
+        writer.write(
+            "Decode a protocol buffer object that corresponds with this class into an instance of this class."
+        )
+        writer.write()
+        writer.write(
+            f"A new instance of this class must be created that matches the protocol buffer object in the '{snake_case_custom_type}_protobuf_object' argument."
+        )
+        writer.write()
+        writer.write(
+            f":param {snake_case_custom_type}_protobuf_object: the protocol buffer object whose type corresponds with this class."
+        )
+        writer.write(
+            f":return: A new instance of this class that matches the protocol buffer object in the '{snake_case_custom_type}_protobuf_object' argument."
+        )
+        writer.write('"""')
+        writer.write("raise NotImplementedError")
+        writer.write()
+        writer.dedent()
+
+        writer.write("def __eq__(self, other):")
+        writer.indent()
+        writer.write("raise NotImplementedError")
+        writer.dedent(2)
+    return writer.getvalue()
+
+
 class ProtocolGenerator:
     """This class generates a protocol_verification package from a ProtocolTemplate object."""
 
@@ -456,42 +715,69 @@ class ProtocolGenerator:
         self.path_to_protocol_package = (
             path_to_protocol_package + self.protocol_specification.name
             if path_to_protocol_package is not None
-            else "{}.{}.protocols.{}".format(
-                PATH_TO_PACKAGES,
-                self.protocol_specification.author,
-                self.protocol_specification.name,
-            )
+            else f"{PATH_TO_PACKAGES}.{self.protocol_specification.author}.protocols.{self.protocol_specification.name}"
         )
 
         self._imports = {
-            "Set": True,
             "Tuple": True,
             "cast": True,
-            "FrozenSet": False,
+            "FrozenSet": True,
             "Dict": False,
             "Union": False,
             "Optional": False,
         }
 
         self._speech_acts = dict()  # type: Dict[str, Dict[str, str]]
+        # (performative, in title case, in upper case, contents) per speech-act
+        self._speech_acts_entries = (
+            ()
+        )  # type: Tuple[Tuple[str, str, str, Dict[str, str]], ...]
         self._all_performatives = list()  # type: List[str]
         self._all_unique_contents = dict()  # type: Dict[str, str]
+        self._all_content_names = list()  # type: List[str]
         self._all_custom_types = list()  # type: List[str]
         self._custom_custom_types = dict()  # type: Dict[str, str]
+        self._custom_custom_content_types = dict()  # type: Dict[str, str]
 
         # dialogue config
         self._initial_performative = ""
         self._reply = dict()  # type: Dict[str, List[str]]
+        self._reply_performatives = list()  # type: List[str]
 
         self._roles = list()  # type: List[str]
         self._end_states = list()  # type: List[str]
 
-        self.indent = ""
+        # container type --> emitter of the element checks of a union content
+        self._union_container_checks = {
+            "frozenset": self._write_union_elements_check,
+            "tuple": self._write_union_elements_check,
+            "dict": self._write_union_dict_check,
+        }
 
-        try:
-            self._setup()
-        except Exception:
-            raise
+        # type prefix --> emitter of the encoding/decoding/protobuf fields of a compositional content
+        self._content_encoders = {
+            "FrozenSet": self._encode_repeated_content,
+            "Tuple": self._encode_repeated_content,
+            "Dict": self._encode_map_content,
+            "Union": self._encode_union_content,
+            "Optional": self._encode_optional_content,
+        }
+        self._content_decoders = {
+            "FrozenSet": self._decode_container_content,
+            "Tuple": self._decode_container_content,
+            "Dict": self._decode_container_content,
+            "Union": self._decode_union_content,
+            "Optional": self._decode_optional_content,
+        }
+        self._content_proto_fields = {
+            "FrozenSet": self._write_repeated_proto_field,
+            "Tuple": self._write_repeated_proto_field,
+            "Dict": self._write_map_proto_field,
+            "Union": self._write_union_proto_fields,
+            "Optional": self._write_optional_proto_fields,
+        }
+
+        self._setup()
 
     def _setup(self) -> None:
         """
@@ -499,53 +785,70 @@ class ProtocolGenerator:
 
         :return: None
         """
-        all_performatives_set = set()
-        all_custom_types_set = set()
-
-        for (
-            performative,
-            speech_act_content_config,
-        ) in self.protocol_specification.speech_acts.read_all():
-            all_performatives_set.add(performative)
-            self._speech_acts[performative] = {}
-            for content_name, content_type in speech_act_content_config.args.items():
-                # check content's name is valid
-                if not _is_valid_content_name(content_name):
-                    raise ProtocolSpecificationParseError(
-                        "Invalid name for content '{}' of performative '{}'. This name is reserved.".format(
-                            content_name, performative,
-                        )
-                    )
+        speech_acts = self.protocol_specification.speech_acts.read_all()
+        contents = [
+            (performative, content_name, content_type)
+            for performative, speech_act_content_config in speech_acts
+            for content_name, content_type in speech_act_content_config.args.items()
+        ]
+
+        # check contents' names are valid
+        invalid_content = next(
+            (
+                (performative, content_name)
+                for performative, content_name, _ in contents
+                if not _is_valid_content_name(content_name)
+            ),
+            None,
+        )
+        if invalid_content is not None:
+            raise ProtocolSpecificationParseError(
+                "Invalid name for content '{}' of performative '{}'. This name is reserved.".format(
+                    invalid_content[1], invalid_content[0],
+                )
+            )
 
-                # determine necessary imports from typing
-                if len(re.findall("pt:set\\[", content_type)) >= 1:
-                    self._imports["FrozenSet"] = True
-                if len(re.findall("pt:dict\\[", content_type)) >= 1:
-                    self._imports["Dict"] = True
-                if len(re.findall("pt:union\\[", content_type)) >= 1:
-                    self._imports["Union"] = True
-                if len(re.findall("pt:optional\\[", content_type)) >= 1:
-                    self._imports["Optional"] = True
-
-                # specification type --> python type
-                pythonic_content_type = _specification_type_to_python_type(content_type)
-
-                # check composition type does not include custom type
-                if _is_composition_type_with_custom_type(pythonic_content_type):
-                    raise ProtocolSpecificationParseError(
-                        "Invalid type for content '{}' of performative '{}'. A custom type cannot be used in the following composition types: [pt:set, pt:list, pt:dict].".format(
-                            content_name, performative,
-                        )
+        # determine necessary imports from typing
+        all_content_types = "\n".join(content_type for _, _, content_type in contents)
+        if "pt:dict[" in all_content_types:
+            self._imports["Dict"] = True
+        if "pt:union[" in all_content_types:
+            self._imports["Union"] = True
+        if "pt:optional[" in all_content_types:
+            self._imports["Optional"] = True
+
+        self._speech_acts = {performative: {} for performative, _ in speech_acts}
+        for performative, content_name, content_type in contents:
+            # specification type --> python type
+            pythonic_content_type = _specification_type_to_python_type(content_type)
+
+            # check composition type does not include custom type
+            if _is_composition_type_with_custom_type(pythonic_content_type):
+                raise ProtocolSpecificationParseError(
+                    "Invalid type for content '{}' of performative '{}'. A custom type cannot be used in the following composition types: [pt:set, pt:list, pt:dict].".format(
+                        content_name, performative,
                     )
+                )
 
-                self._all_unique_contents[content_name] = pythonic_content_type
-                self._speech_acts[performative][content_name] = pythonic_content_type
-                if content_type.startswith("ct:"):
-                    all_custom_types_set.add(pythonic_content_type)
+            self._all_unique_contents[content_name] = pythonic_content_type
+            self._speech_acts[performative][content_name] = pythonic_content_type
+        self._speech_acts_entries = tuple(
+            (performative, performative.title(), performative.upper(), contents)
+            for performative, contents in self._speech_acts.items()
+        )
 
         # sort the sets
-        self._all_performatives = sorted(all_performatives_set)
-        self._all_custom_types = sorted(all_custom_types_set)
+        self._all_performatives = sorted(
+            {performative for performative, _ in speech_acts}
+        )
+        self._all_content_names = sorted(self._all_unique_contents.keys())
+        self._all_custom_types = sorted(
+            {
+                _ct_specification_type_to_python_type(content_type)
+                for _, _, content_type in contents
+                if content_type.startswith("ct:")
+            }
+        )
 
         # "XXX" custom type --> "CustomXXX"
         self._custom_custom_types = {
@@ -553,22 +856,31 @@ class ProtocolGenerator:
             for pure_custom_type in self._all_custom_types
         }
 
+        # content type --> content type with "CustomXXX" custom types (incl. optional's sub-type)
+        for speech_act_contents in self._speech_acts.values():
+            for content_type in speech_act_contents.values():
+                self._to_custom_custom(content_type)
+                if content_type.startswith("Optional["):
+                    self._to_custom_custom(
+                        _get_sub_types_of_compositional_types(content_type)[0]
+                    )
+
         # Dialogue attributes
         if (
             self.protocol_specification.dialogue_config != {}
             and self.protocol_specification.dialogue_config is not None
         ):
             self._reply = self.protocol_specification.dialogue_config["reply"]
+            self._reply_performatives = sorted(self._reply.keys())
             roles_set = self.protocol_specification.dialogue_config["roles"]  # type: ignore
             self._roles = sorted(roles_set, reverse=True)
             self._end_states = self.protocol_specification.dialogue_config["end_states"]  # type: ignore
 
             # infer initial performative
             set_of_all_performatives = set(self._reply.keys())
-            set_of_all_replies = set()
-            for _, list_of_replies in self._reply.items():
-                set_of_replies = set(list_of_replies)
-                set_of_all_replies.update(set_of_replies)
+            set_of_all_replies = set(
+                itertools.chain.from_iterable(self._reply.values())
+            )
             initial_performative_set = set_of_all_performatives.difference(
                 set_of_all_replies
             )
@@ -584,37 +896,6 @@ class ProtocolGenerator:
 
             self._initial_performative = initial_performative
 
-    def _change_indent(self, number: int, mode: str = None) -> None:
-        """
-        Update the value of 'indent' global variable.
-
-        This function controls the indentation of the code produced throughout the generator.
-
-        There are two modes:
-        - Setting the indent to a desired 'number' level. In this case, 'mode' has to be set to "s".
-        - Updating the incrementing/decrementing the indentation level by 'number' amounts. In this case 'mode' is None.
-
-        :param number: the number of indentation levels to set/increment/decrement
-        :param mode: the mode of indentation change
-        :return: None
-        """
-        if mode and mode == "s":
-            if number >= 0:
-                self.indent = number * "    "
-            else:
-                raise ValueError("Error: setting indent to be a negative number.")
-        else:
-            if number >= 0:
-                for _ in itertools.repeat(None, number):
-                    self.indent += "    "
-            else:
-                if abs(number) <= len(self.indent) / 4:
-                    self.indent = self.indent[abs(number) * 4 :]
-                else:
-                    raise ValueError(
-                        "Not enough spaces in the 'indent' variable to remove."
-                    )
-
     def _import_from_typing_module(self) -> str:
         """
         Manage import statement for the typing package.
@@ -625,16 +906,14 @@ class ProtocolGenerator:
             "Dict",
             "FrozenSet",
             "Optional",
-            "Set",
             "Tuple",
             "Union",
             "cast",
         ]
-        import_str = "from typing import "
-        for package in ordered_packages:
-            if self._imports[package]:
-                import_str += "{}, ".format(package)
-        import_str = import_str[:-2]
+        imported_packages = ", ".join(
+            package for package in ordered_packages if self._imports[package]
+        )
+        import_str = f"from typing import {imported_packages}"
         return import_str
 
     def _import_from_custom_types_module(self) -> str:
@@ -643,1669 +922,1347 @@ class ProtocolGenerator:
 
         :return: import statement for the custom_types module
         """
-        import_str = ""
-        if len(self._all_custom_types) == 0:
-            pass
-        else:
-            for custom_class in self._all_custom_types:
-                import_str += "from {}.custom_types import {} as Custom{}\n".format(
-                    self.path_to_protocol_package, custom_class, custom_class,
-                )
-            import_str = import_str[:-1]
+        import_str = "\n".join(
+            CUSTOM_TYPE_IMPORT_TEMPLATE.format(
+                path_to_protocol_package=self.path_to_protocol_package,
+                custom_type=custom_class,
+            )
+            for custom_class in self._all_custom_types
+        )
         return import_str
 
     def _performatives_str(self) -> str:
         """
-        Generate the performatives instance property string, a set containing all valid performatives of this protocol.
+        Generate the performatives class attribute string, a frozenset containing all valid performatives of this protocol.
 
-        :return: the performatives set string
+        :return: the performatives frozenset string
         """
-        performatives_str = "{"
-        for performative in self._all_performatives:
-            performatives_str += '"{}", '.format(performative)
-        performatives_str = performatives_str[:-2]
-        performatives_str += "}"
+        performatives = ", ".join(
+            f'"{performative}"' for performative in self._all_performatives
+        )
+        performatives_str = f"frozenset({{{performatives}}})"
         return performatives_str
 
-    def _performatives_enum_str(self) -> str:
+    def _write_performatives_enum(self, writer: IndentWriter) -> None:
         """
         Generate the performatives Enum class.
 
-        :return: the performatives Enum string
+        :param writer: the writer to emit the Enum class into
+        :return: None
         """
-        enum_str = self.indent + "class Performative(Enum):\n"
-        self._change_indent(1)
-        enum_str += self.indent + '"""Performatives for the {} protocol."""\n\n'.format(
-            self.protocol_specification.name
+        writer.write("class Performative(Enum):")
+        writer.indent()
+        writer.write(
+            f'"""Performatives for the {self.protocol_specification.name} protocol."""'
         )
+        writer.write()
         for performative in self._all_performatives:
-            enum_str += self.indent + '{} = "{}"\n'.format(
-                performative.upper(), performative
-            )
-        enum_str += "\n"
-        enum_str += self.indent + "def __str__(self):\n"
-        self._change_indent(1)
-        enum_str += self.indent + '"""Get the string representation."""\n'
-        enum_str += self.indent + "return self.value\n"
-        self._change_indent(-1)
-        enum_str += "\n"
-        self._change_indent(-1)
-
-        return enum_str
-
-    def _check_content_type_str(self, content_name: str, content_type: str) -> str:
+            writer.write(f'{performative.upper()} = "{performative}"')
+        writer.write()
+        writer.write("def __str__(self):")
+        writer.indent()
+        writer.write('"""Get the string representation."""')
+        writer.write("return self.value")
+        writer.dedent()
+        writer.write()
+        writer.dedent()
+
+    def _write_content_type_check(
+        self, writer: IndentWriter, content_name: str, content_type: str
+    ) -> None:
         """
         Produce the checks of elements of compositional types.
 
+        :param writer: the writer to emit the checks into
         :param content_name: the name of the content to be checked
         :param content_type: the type of the content to be checked
-        :return: the string containing the checks.
+        :return: None
         """
-        check_str = ""
+        # a prefixed local, so that a content cannot shadow the builtins used below
+        content_variable = f"content_of_{content_name}"
         if content_type.startswith("Optional["):
             optional = True
-            check_str += self.indent + 'if self.is_set("{}"):\n'.format(content_name)
-            self._change_indent(1)
-            check_str += self.indent + "expected_nb_of_contents += 1\n"
+            writer.write(f'if self.is_set("{content_name}"):')
+            writer.indent()
+            writer.write("nb_of_optional_contents += 1")
             content_type = _get_sub_types_of_compositional_types(content_type)[0]
-            check_str += self.indent + "{} = cast({}, self.{})\n".format(
-                content_name, self._to_custom_custom(content_type), content_name
+            writer.write(
+                f"{content_variable} = cast({self._custom_custom_content_types[content_type]}, self.{content_name})"
             )
-            content_variable = content_name
         else:
             optional = False
-            content_variable = "self." + content_name
+            writer.write(f"{content_variable} = self.{content_name}")
         if content_type.startswith("Union["):
-            element_types = _get_sub_types_of_compositional_types(content_type)
+            # group the sub-types of the compositional element types by container type
             unique_standard_types_set = set()
-            for typing_content_type in element_types:
-                if typing_content_type.startswith("FrozenSet"):
-                    unique_standard_types_set.add("frozenset")
-                elif typing_content_type.startswith("Tuple"):
-                    unique_standard_types_set.add("tuple")
-                elif typing_content_type.startswith("Dict"):
-                    unique_standard_types_set.add("dict")
-                else:
-                    unique_standard_types_set.add(typing_content_type)
-            unique_standard_types_list = sorted(unique_standard_types_set)
-            check_str += self.indent
-            check_str += "assert "
-            for unique_type in unique_standard_types_list:
-                check_str += "type({}) == {} or ".format(
-                    content_variable, self._to_custom_custom(unique_type)
+            container_sub_types = dict()  # type: Dict[str, Dict[str, Tuple[str, ...]]]
+            for element_type in _get_sub_types_of_compositional_types(content_type):
+                container_type = UNION_CONTAINER_TYPES.get(
+                    _get_type_prefix(element_type)
                 )
-            check_str = check_str[:-4]
-            check_str += ", \"Invalid type for content '{}'. Expected either of '{}'. Found '{{}}'.\".format(type({}))\n".format(
-                content_name,
-                [
-                    unique_standard_type
-                    for unique_standard_type in unique_standard_types_list
-                ],
-                content_variable,
-            )
-            if "frozenset" in unique_standard_types_list:
-                check_str += self.indent + "if type({}) == frozenset:\n".format(
-                    content_variable
-                )
-                self._change_indent(1)
-                check_str += self.indent + "assert (\n"
-                self._change_indent(1)
-                frozen_set_element_types_set = set()
-                for element_type in element_types:
-                    if element_type.startswith("FrozenSet"):
-                        frozen_set_element_types_set.add(
-                            _get_sub_types_of_compositional_types(element_type)[0]
-                        )
-                frozen_set_element_types = sorted(frozen_set_element_types_set)
-                for frozen_set_element_type in frozen_set_element_types:
-                    check_str += (
-                        self.indent
-                        + "all(type(element) == {} for element in {}) or\n".format(
-                            self._to_custom_custom(frozen_set_element_type),
-                            content_variable,
-                        )
-                    )
-                check_str = check_str[:-4]
-                check_str += "\n"
-                self._change_indent(-1)
-                if len(frozen_set_element_types) == 1:
-                    check_str += (
-                        self.indent
-                        + "), \"Invalid type for elements of content '{}'. Expected ".format(
-                            content_name
-                        )
-                    )
-                    for frozen_set_element_type in frozen_set_element_types:
-                        check_str += "'{}'".format(
-                            self._to_custom_custom(frozen_set_element_type)
-                        )
-                    check_str += '."\n'
-                else:
-                    check_str += (
-                        self.indent
-                        + "), \"Invalid type for frozenset elements in content '{}'. Expected either ".format(
-                            content_name
-                        )
-                    )
-                    for frozen_set_element_type in frozen_set_element_types:
-                        check_str += "'{}' or ".format(
-                            self._to_custom_custom(frozen_set_element_type)
-                        )
-                    check_str = check_str[:-4]
-                    check_str += '."\n'
-                self._change_indent(-1)
-            if "tuple" in unique_standard_types_list:
-                check_str += self.indent + "if type({}) == tuple:\n".format(
-                    content_variable
-                )
-                self._change_indent(1)
-                check_str += self.indent + "assert (\n"
-                self._change_indent(1)
-                tuple_element_types_set = set()
-                for element_type in element_types:
-                    if element_type.startswith("Tuple"):
-                        tuple_element_types_set.add(
-                            _get_sub_types_of_compositional_types(element_type)[0]
-                        )
-                tuple_element_types = sorted(tuple_element_types_set)
-                for tuple_element_type in tuple_element_types:
-                    check_str += (
-                        self.indent
-                        + "all(type(element) == {} for element in {}) or \n".format(
-                            self._to_custom_custom(tuple_element_type), content_variable
-                        )
-                    )
-                check_str = check_str[:-4]
-                check_str += "\n"
-                self._change_indent(-1)
-                if len(tuple_element_types) == 1:
-                    check_str += (
-                        self.indent
-                        + "), \"Invalid type for tuple elements in content '{}'. Expected ".format(
-                            content_name
-                        )
-                    )
-                    for tuple_element_type in tuple_element_types:
-                        check_str += "'{}'".format(
-                            self._to_custom_custom(tuple_element_type)
-                        )
-                    check_str += '."\n'
-                else:
-                    check_str += (
-                        self.indent
-                        + "), \"Invalid type for tuple elements in content '{}'. Expected either ".format(
-                            content_name
-                        )
-                    )
-                    for tuple_element_type in tuple_element_types:
-                        check_str += "'{}' or ".format(
-                            self._to_custom_custom(tuple_element_type)
-                        )
-                    check_str = check_str[:-4]
-                    check_str += '."\n'
-                self._change_indent(-1)
-            if "dict" in unique_standard_types_list:
-                check_str += self.indent + "if type({}) == dict:\n".format(
-                    content_variable
-                )
-                self._change_indent(1)
-                check_str += (
-                    self.indent
-                    + "for key_of_{}, value_of_{} in {}.items():\n".format(
-                        content_name, content_name, content_variable
-                    )
+                if container_type is None:
+                    unique_standard_types_set.add(element_type)
+                    continue
+                unique_standard_types_set.add(container_type)
+                sub_types = _get_sub_types_of_compositional_types(element_type)
+                sub_types_by_first = container_sub_types.setdefault(
+                    container_type, dict()
                 )
-                self._change_indent(1)
-                check_str += self.indent + "assert (\n"
-                self._change_indent(1)
-                dict_key_value_types = dict()
-                for element_type in element_types:
-                    if element_type.startswith("Dict"):
-                        dict_key_value_types[
-                            _get_sub_types_of_compositional_types(element_type)[0]
-                        ] = _get_sub_types_of_compositional_types(element_type)[1]
-                for element1_type in sorted(dict_key_value_types.keys()):
-                    check_str += (
-                        self.indent
-                        + "(type(key_of_{}) == {} and type(value_of_{}) == {}) or\n".format(
-                            content_name,
-                            self._to_custom_custom(element1_type),
-                            content_name,
-                            self._to_custom_custom(dict_key_value_types[element1_type]),
-                        )
-                    )
-                check_str = check_str[:-4]
-                check_str += "\n"
-                self._change_indent(-1)
-
-                if len(dict_key_value_types) == 1:
-                    check_str += (
-                        self.indent
-                        + "), \"Invalid type for dictionary key, value in content '{}'. Expected ".format(
-                            content_name
-                        )
-                    )
-                    for key in sorted(dict_key_value_types.keys()):
-                        check_str += "'{}', '{}'".format(key, dict_key_value_types[key])
-                    check_str += '."\n'
-                else:
-                    check_str += (
-                        self.indent
-                        + "), \"Invalid type for dictionary key, value in content '{}'. Expected ".format(
-                            content_name
-                        )
+                sub_types_by_first[sub_types[0]] = sub_types
+            unique_standard_types_list = sorted(unique_standard_types_set)
+            type_checks = " or ".join(
+                f"type({content_variable}) is {self._to_custom_custom(unique_type)}"
+                for unique_type in unique_standard_types_list
+            )
+            writer.write(
+                f"assert {type_checks}, \"Invalid type for content '{content_name}'. Expected either of '{unique_standard_types_list}'. Found '{{}}'.\".format(type({content_variable}))"
+            )
+            for container_type, write_check in self._union_container_checks.items():
+                if container_type in container_sub_types:
+                    writer.write(f"if type({content_variable}) is {container_type}:")
+                    writer.indent()
+                    write_check(
+                        writer,
+                        container_type,
+                        container_sub_types[container_type],
+                        content_name,
+                        content_variable,
                     )
-                    for key in sorted(dict_key_value_types.keys()):
-                        check_str += "'{}','{}' or ".format(
-                            key, dict_key_value_types[key]
-                        )
-                    check_str = check_str[:-4]
-                    check_str += '."\n'
-                self._change_indent(-2)
-        elif content_type.startswith("FrozenSet["):
-            # check the type
-            check_str += (
-                self.indent
-                + "assert type({}) == frozenset, \"Invalid type for content '{}'. Expected 'frozenset'. Found '{{}}'.\".format(type({}))\n".format(
-                    content_variable, content_name, content_variable
-                )
-            )
-            element_type = _get_sub_types_of_compositional_types(content_type)[0]
-            check_str += self.indent + "assert all(\n"
-            self._change_indent(1)
-            check_str += self.indent + "type(element) == {} for element in {}\n".format(
-                self._to_custom_custom(element_type), content_variable
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + "), \"Invalid type for frozenset elements in content '{}'. Expected '{}'.\"\n".format(
-                    content_name, element_type
-                )
+                    writer.dedent()
+        elif content_type.startswith(("FrozenSet[", "Tuple[")):
+            container_type = (
+                "frozenset" if content_type.startswith("FrozenSet[") else "tuple"
             )
-        elif content_type.startswith("Tuple["):
             # check the type
-            check_str += (
-                self.indent
-                + "assert type({}) == tuple, \"Invalid type for content '{}'. Expected 'tuple'. Found '{{}}'.\".format(type({}))\n".format(
-                    content_variable, content_name, content_variable
+            writer.write(
+                CONTENT_TYPE_ASSERTION_TEMPLATE.substitute(
+                    variable=content_variable,
+                    python_type=container_type,
+                    name=content_name,
+                    expected=container_type,
                 )
             )
             element_type = _get_sub_types_of_compositional_types(content_type)[0]
-            check_str += self.indent + "assert all(\n"
-            self._change_indent(1)
-            check_str += self.indent + "type(element) == {} for element in {}\n".format(
-                self._to_custom_custom(element_type), content_variable
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + "), \"Invalid type for tuple elements in content '{}'. Expected '{}'.\"\n".format(
-                    content_name, element_type
+            writer.write("assert all(")
+            writer.indent()
+            writer.write(
+                f"type(element) is {self._to_custom_custom(element_type)} for element in {content_variable}"
+            )
+            writer.dedent()
+            writer.write(
+                ELEMENTS_ASSERTION_MESSAGE_TEMPLATE.substitute(
+                    container=container_type, name=content_name, expected=element_type
                 )
             )
         elif content_type.startswith("Dict["):
             # check the type
-            check_str += (
-                self.indent
-                + "assert type({}) == dict, \"Invalid type for content '{}'. Expected 'dict'. Found '{{}}'.\".format(type({}))\n".format(
-                    content_variable, content_name, content_variable
+            writer.write(
+                CONTENT_TYPE_ASSERTION_TEMPLATE.substitute(
+                    variable=content_variable,
+                    python_type="dict",
+                    name=content_name,
+                    expected="dict",
                 )
             )
-            element_type_1 = _get_sub_types_of_compositional_types(content_type)[0]
-            element_type_2 = _get_sub_types_of_compositional_types(content_type)[1]
             # check the keys type then check the values type
-            check_str += (
-                self.indent
-                + "for key_of_{}, value_of_{} in {}.items():\n".format(
-                    content_name, content_name, content_variable
+            writer.write(
+                f"for key_of_{content_name}, value_of_{content_name} in {content_variable}.items():"
+            )
+            writer.indent()
+            for part, element_type in zip(
+                ("key", "value"), _get_sub_types_of_compositional_types(content_type)
+            ):
+                writer.write("assert (")
+                writer.indent()
+                writer.write(
+                    f"type({part}_of_{content_name}) is {self._to_custom_custom(element_type)}"
                 )
-            )
-            self._change_indent(1)
-            check_str += self.indent + "assert (\n"
-            self._change_indent(1)
-            check_str += self.indent + "type(key_of_{}) == {}\n".format(
-                content_name, self._to_custom_custom(element_type_1)
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + "), \"Invalid type for dictionary keys in content '{}'. Expected '{}'. Found '{{}}'.\".format(type(key_of_{}))\n".format(
-                    content_name, element_type_1, content_name
+                writer.dedent()
+                writer.write(
+                    DICT_ASSERTION_MESSAGE_TEMPLATE.substitute(
+                        part=part, name=content_name, expected=element_type
+                    )
+                )
+            writer.dedent()
+        else:
+            writer.write(
+                CONTENT_TYPE_ASSERTION_TEMPLATE.substitute(
+                    variable=content_variable,
+                    python_type=self._custom_custom_content_types[content_type],
+                    name=content_name,
+                    expected=content_type,
                 )
             )
+        if optional:
+            writer.dedent()
 
-            check_str += self.indent + "assert (\n"
-            self._change_indent(1)
-            check_str += self.indent + "type(value_of_{}) == {}\n".format(
-                content_name, self._to_custom_custom(element_type_2)
-            )
-            self._change_indent(-1)
-            check_str += (
-                self.indent
-                + "), \"Invalid type for dictionary values in content '{}'. Expected '{}'. Found '{{}}'.\".format(type(value_of_{}))\n".format(
-                    content_name, element_type_2, content_name
-                )
+    def _write_union_elements_check(
+        self,
+        writer: IndentWriter,
+        container_type: str,
+        sub_types: Dict[str, Tuple[str, ...]],
+        content_name: str,
+        content_variable: str,
+    ) -> None:
+        """
+        Produce the checks of the elements of a frozenset or tuple in a union content.
+
+        :param writer: the writer to emit the checks into
+        :param container_type: the container type, i.e. 'frozenset' or 'tuple'
+        :param sub_types: the sub-types of the container types in the union, keyed by element type
+        :param content_name: the name of the content to be checked
+        :param content_variable: the variable holding the content in the generated code
+        :return: None
+        """
+        element_types = [
+            self._to_custom_custom(element_type) for element_type in sorted(sub_types)
+        ]
+        if len(element_types) == 1:
+            writer.write("assert (")
+            writer.indent()
+            writer.write(
+                f"all(type(element) is {element_types[0]} for element in {content_variable})"
             )
-            self._change_indent(-1)
         else:
-            check_str += (
-                self.indent
-                + "assert type({}) == {}, \"Invalid type for content '{}'. Expected '{}'. Found '{{}}'.\".format(type({}))\n".format(
-                    content_variable,
-                    self._to_custom_custom(content_type),
-                    content_name,
-                    content_type,
-                    content_variable,
+            # one pass over the elements: they must all share one of the allowed types
+            types_variable = f"element_types_of_{content_name}"
+            writer.write(
+                f"{types_variable} = {{type(element) for element in {content_variable}}}"
+            )
+            writer.write("assert (")
+            writer.indent()
+            writer.write(
+                f"len({types_variable}) <= 1 and {types_variable} <= {{{', '.join(element_types)}}}"
+            )
+        writer.dedent()
+        if len(element_types) == 1:
+            if container_type == "frozenset":
+                expected = (
+                    f"Invalid type for elements of content '{content_name}'. Expected "
                 )
-            )
-        if optional:
-            self._change_indent(-1)
-        return check_str
+            else:
+                expected = f"Invalid type for {container_type} elements in content '{content_name}'. Expected "
+        else:
+            expected = f"Invalid type for {container_type} elements in content '{content_name}'. Expected either "
+        expected_types = " or ".join(
+            f"'{element_type}'" for element_type in element_types
+        )
+        writer.write(f'), "{expected}{expected_types}."')
+
+    def _write_union_dict_check(
+        self,
+        writer: IndentWriter,
+        container_type: str,
+        sub_types: Dict[str, Tuple[str, ...]],
+        content_name: str,
+        content_variable: str,
+    ) -> None:
+        """
+        Produce the checks of the keys and values of a dictionary in a union content.
+
+        :param writer: the writer to emit the checks into
+        :param container_type: the container type, i.e. 'dict'
+        :param sub_types: the key and value types of the dictionary types in the union, keyed by key type
+        :param content_name: the name of the content to be checked
+        :param content_variable: the variable holding the content in the generated code
+        :return: None
+        """
+        key_value_types = [
+            (key_type, sub_types[key_type][1]) for key_type in sorted(sub_types)
+        ]
+        writer.write(
+            f"for key_of_{content_name}, value_of_{content_name} in {content_variable}.items():"
+        )
+        writer.indent()
+        writer.write("assert (")
+        writer.indent()
+        conditions = [
+            f"(type(key_of_{content_name}) is {self._to_custom_custom(key_type)} and type(value_of_{content_name}) is {self._to_custom_custom(value_type)})"
+            for key_type, value_type in key_value_types
+        ]
+        for condition in conditions[:-1]:
+            writer.write(condition + " or")
+        writer.write(conditions[-1])
+        writer.dedent()
+        if len(key_value_types) == 1:
+            key_value_types_separator = ", "
+        else:
+            key_value_types_separator = ","
+        expected_types = " or ".join(
+            f"'{key_type}'{key_value_types_separator}'{value_type}'"
+            for key_type, value_type in key_value_types
+        )
+        writer.write(
+            f"), \"Invalid type for dictionary key, value in content '{content_name}'. Expected {expected_types}.\""
+        )
+        writer.dedent()
 
-    def _message_class_str(self) -> str:
+    def _write_message_module(self, writer: IndentWriter) -> None:
         """
-        Produce the content of the Message class.
+        Write the content of the Message class.
 
-        :return: the message.py file content
+        :param writer: the writer to emit the message.py content into
+        :return: None
         """
-        self._change_indent(0, "s")
+        protocol_name = self.protocol_specification.name
+        message_class_name = f"{self.protocol_specification_in_camel_case}Message"
 
         # Header
-        cls_str = _copyright_header_str(self.protocol_specification.author) + "\n"
+        writer.write_raw(_copyright_header_str(self.protocol_specification.author))
+        writer.write()
 
         # Module docstring
-        cls_str += (
-            self.indent
-            + '"""This module contains {}\'s message definition."""\n\n'.format(
-                self.protocol_specification.name
-            )
+        writer.write(
+            f'"""This module contains {protocol_name}\'s message definition."""'
         )
+        writer.write()
 
         # Imports
-        cls_str += self.indent + "import logging\n"
-        cls_str += self.indent + "from enum import Enum\n"
-        cls_str += self._import_from_typing_module() + "\n\n"
-        cls_str += self.indent + "from aea.configurations.base import ProtocolId\n"
-        cls_str += MESSAGE_IMPORT + "\n"
-        if self._import_from_custom_types_module() != "":
-            cls_str += "\n" + self._import_from_custom_types_module() + "\n"
-        else:
-            cls_str += self._import_from_custom_types_module()
-        cls_str += (
-            self.indent
-            + '\nlogger = logging.getLogger("aea.packages.{}.protocols.{}.message")\n'.format(
-                self.protocol_specification.author, self.protocol_specification.name
-            )
+        writer.write("import logging")
+        writer.write("from enum import Enum")
+        writer.write(self._import_from_typing_module())
+        writer.write()
+        writer.write("from aea.configurations.base import ProtocolId")
+        writer.write(MESSAGE_IMPORT)
+        import_from_custom_types_module = self._import_from_custom_types_module()
+        if import_from_custom_types_module != "":
+            writer.write()
+            writer.write(import_from_custom_types_module)
+        writer.write()
+        writer.write(
+            f'logger = logging.getLogger("aea.packages.{self.protocol_specification.author}.protocols.{protocol_name}.message")'
+        )
+        writer.write()
+        writer.write("DEFAULT_BODY_SIZE = 4")
+        writer.write(
+            "INVALID_CONTENT_TYPE_MSG = \"Invalid type for content '{}'. Expected '{}'. Found '{}'.\""
+        )
+        writer.write()
+        writer.write(
+            f'PROTOCOL_ID = ProtocolId("{self.protocol_specification.author}", "{protocol_name}", "{self.protocol_specification.version}")'
         )
-        cls_str += self.indent + "\nDEFAULT_BODY_SIZE = 4\n"
 
         # Class Header
-        cls_str += self.indent + "\n\nclass {}Message(Message):\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(1)
-        cls_str += self.indent + '"""{}"""\n\n'.format(
-            self.protocol_specification.description
-        )
+        writer.write()
+        writer.write()
+        writer.write(f"class {message_class_name}(Message):")
+        writer.indent()
+        writer.write(f'"""{self.protocol_specification.description}"""')
+        writer.write()
 
         # Class attributes
-        cls_str += self.indent + 'protocol_id = ProtocolId("{}", "{}", "{}")\n'.format(
-            self.protocol_specification.author,
-            self.protocol_specification.name,
-            self.protocol_specification.version,
+        writer.write("protocol_id = PROTOCOL_ID")
+        writer.write()
+        writer.write(
+            f"_performatives = {self._performatives_str()}  # type: FrozenSet[str]"
         )
         for custom_type in self._all_custom_types:
-            cls_str += "\n"
-            cls_str += self.indent + "{} = Custom{}\n".format(custom_type, custom_type)
+            writer.write()
+            writer.write(f"{custom_type} = Custom{custom_type}")
 
         # Performatives Enum
-        cls_str += "\n" + self._performatives_enum_str()
+        writer.write()
+        self._write_performatives_enum(writer)
 
         # __init__
-        cls_str += self.indent + "def __init__(\n"
-        self._change_indent(1)
-        cls_str += self.indent + "self,\n"
-        cls_str += self.indent + "performative: Performative,\n"
-        cls_str += self.indent + 'dialogue_reference: Tuple[str, str] = ("", ""),\n'
-        cls_str += self.indent + "message_id: int = 1,\n"
-        cls_str += self.indent + "target: int = 0,\n"
-        cls_str += self.indent + "**kwargs,\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "):\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Initialise an instance of {}Message.\n\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        cls_str += self.indent + ":param message_id: the message id.\n"
-        cls_str += self.indent + ":param dialogue_reference: the dialogue reference.\n"
-        cls_str += self.indent + ":param target: the message target.\n"
-        cls_str += self.indent + ":param performative: the message performative.\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "super().__init__(\n"
-        self._change_indent(1)
-        cls_str += self.indent + "dialogue_reference=dialogue_reference,\n"
-        cls_str += self.indent + "message_id=message_id,\n"
-        cls_str += self.indent + "target=target,\n"
-        cls_str += (
-            self.indent
-            + "performative={}Message.Performative(performative),\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        cls_str += self.indent + "**kwargs,\n"
-        self._change_indent(-1)
-        cls_str += self.indent + ")\n"
-        cls_str += self.indent + "self._performatives = {}\n".format(
-            self._performatives_str()
-        )
-        self._change_indent(-1)
+        writer.write("def __init__(")
+        writer.indent()
+        writer.write("self,")
+        writer.write("performative: Performative,")
+        writer.write('dialogue_reference: Tuple[str, str] = ("", ""),')
+        writer.write("message_id: int = 1,")
+        writer.write("target: int = 0,")
+        writer.write("**kwargs,")
+        writer.dedent()
+        writer.write("):")
+        writer.indent()
+        writer.write('"""')
+        writer.write(f"Initialise an instance of {message_class_name}.")
+        writer.write()
+        writer.write(":param message_id: the message id.")
+        writer.write(":param dialogue_reference: the dialogue reference.")
+        writer.write(":param target: the message target.")
+        writer.write(":param performative: the message performative.")
+        writer.write('"""')
+        writer.write("super().__init__(")
+        writer.indent()
+        writer.write("dialogue_reference=dialogue_reference,")
+        writer.write("message_id=message_id,")
+        writer.write("target=target,")
+        writer.write(f"performative={message_class_name}.Performative(performative),")
+        writer.write("**kwargs,")
+        writer.dedent()
+        writer.write(")")
+        writer.dedent()
 
         # Instance properties
-        cls_str += self.indent + "@property\n"
-        cls_str += self.indent + "def valid_performatives(self) -> Set[str]:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""Get valid performatives."""\n'
-        cls_str += self.indent + "return self._performatives\n\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "@property\n"
-        cls_str += self.indent + "def dialogue_reference(self) -> Tuple[str, str]:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""Get the dialogue_reference of the message."""\n'
-        cls_str += (
-            self.indent
-            + 'assert self.is_set("dialogue_reference"), "dialogue_reference is not set."\n'
-        )
-        cls_str += (
-            self.indent
-            + 'return cast(Tuple[str, str], self.get("dialogue_reference"))\n\n'
-        )
-        self._change_indent(-1)
-        cls_str += self.indent + "@property\n"
-        cls_str += self.indent + "def message_id(self) -> int:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""Get the message_id of the message."""\n'
-        cls_str += (
-            self.indent + 'assert self.is_set("message_id"), "message_id is not set."\n'
-        )
-        cls_str += self.indent + 'return cast(int, self.get("message_id"))\n\n'
-        self._change_indent(-1)
-        cls_str += self.indent + "@property\n"
-        cls_str += (
-            self.indent + "def performative(self) -> Performative:  # noqa: F821\n"
-        )
-        self._change_indent(1)
-        cls_str += self.indent + '"""Get the performative of the message."""\n'
-        cls_str += (
-            self.indent
-            + 'assert self.is_set("performative"), "performative is not set."\n'
-        )
-        cls_str += (
-            self.indent
-            + 'return cast({}Message.Performative, self.get("performative"))\n\n'.format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        self._change_indent(-1)
-        cls_str += self.indent + "@property\n"
-        cls_str += self.indent + "def target(self) -> int:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""Get the target of the message."""\n'
-        cls_str += self.indent + 'assert self.is_set("target"), "target is not set."\n'
-        cls_str += self.indent + 'return cast(int, self.get("target"))\n\n'
-        self._change_indent(-1)
-
-        for content_name in sorted(self._all_unique_contents.keys()):
+        writer.write("@property")
+        writer.write("def valid_performatives(self) -> FrozenSet[str]:")
+        writer.indent()
+        writer.write('"""Get valid performatives."""')
+        writer.write("return self._performatives")
+        writer.write()
+        writer.dedent()
+        writer.write("@property")
+        writer.write("def dialogue_reference(self) -> Tuple[str, str]:")
+        writer.indent()
+        writer.write('"""Get the dialogue_reference of the message."""')
+        writer.write(
+            'assert self.is_set("dialogue_reference"), "dialogue_reference is not set."'
+        )
+        writer.write('return cast(Tuple[str, str], self.get("dialogue_reference"))')
+        writer.write()
+        writer.dedent()
+        writer.write("@property")
+        writer.write("def message_id(self) -> int:")
+        writer.indent()
+        writer.write('"""Get the message_id of the message."""')
+        writer.write('assert self.is_set("message_id"), "message_id is not set."')
+        writer.write('return cast(int, self.get("message_id"))')
+        writer.write()
+        writer.dedent()
+        writer.write("@property")
+        writer.write("def performative(self) -> Performative:  # noqa: F821")
+        writer.indent()
+        writer.write('"""Get the performative of the message."""')
+        writer.write('assert self.is_set("performative"), "performative is not set."')
+        writer.write(
+            f'return cast({message_class_name}.Performative, self.get("performative"))'
+        )
+        writer.write()
+        writer.dedent()
+        writer.write("@property")
+        writer.write("def target(self) -> int:")
+        writer.indent()
+        writer.write('"""Get the target of the message."""')
+        writer.write('assert self.is_set("target"), "target is not set."')
+        writer.write('return cast(int, self.get("target"))')
+        writer.write()
+        writer.dedent()
+
+        for content_name in self._all_content_names:
             content_type = self._all_unique_contents[content_name]
-            cls_str += self.indent + "@property\n"
-            cls_str += self.indent + "def {}(self) -> {}:\n".format(
-                content_name, self._to_custom_custom(content_type)
-            )
-            self._change_indent(1)
-            cls_str += (
-                self.indent
-                + '"""Get the \'{}\' content from the message."""\n'.format(
-                    content_name
-                )
+            writer.write("@property")
+            writer.write(
+                f"def {content_name}(self) -> {self._custom_custom_content_types[content_type]}:"
             )
+            writer.indent()
+            writer.write(f'"""Get the \'{content_name}\' content from the message."""')
             if not content_type.startswith("Optional"):
-                cls_str += (
-                    self.indent
-                    + 'assert self.is_set("{}"), "\'{}\' content is not set."\n'.format(
-                        content_name, content_name
-                    )
+                writer.write(
+                    f'assert self.is_set("{content_name}"), "\'{content_name}\' content is not set."'
                 )
-            cls_str += self.indent + 'return cast({}, self.get("{}"))\n\n'.format(
-                self._to_custom_custom(content_type), content_name
-            )
-            self._change_indent(-1)
+            writer.write(f'return self.get("{content_name}")')
+            writer.write()
+            writer.dedent()
+
+        # number of non-optional contents of each performative
+        writer.write("_EXPECTED_CONTENT_COUNT = {")
+        writer.indent()
+        for _, _, upper_case, contents in self._speech_acts_entries:
+            nb_of_non_optional_contents = sum(
+                1
+                for content_type in contents.values()
+                if not content_type.startswith("Optional")
+            )
+            writer.write(f"Performative.{upper_case}: {nb_of_non_optional_contents},")
+        writer.dedent()
+        writer.write("}")
+        writer.write()
+
+        # content checks, one method per performative
+        for performative, _, _, contents in self._speech_acts_entries:
+            writer.write(f"def _check_{performative}(self) -> int:")
+            writer.indent()
+            writer.write(
+                f'"""Check the contents of a \'{performative}\' message and return the number of optional contents set."""'
+            )
+            has_optional_contents = any(
+                content_type.startswith("Optional")
+                for content_type in contents.values()
+            )
+            if has_optional_contents:
+                writer.write("nb_of_optional_contents = 0")
+            for content_name, content_type in contents.items():
+                self._write_content_type_check(writer, content_name, content_type)
+            if has_optional_contents:
+                writer.write("return nb_of_optional_contents")
+            else:
+                writer.write("return 0")
+            writer.write()
+            writer.dedent()
+        writer.write("_CHECKERS = {")
+        writer.indent()
+        for performative, _, upper_case, _ in self._speech_acts_entries:
+            writer.write(f"Performative.{upper_case}: _check_{performative},")
+        writer.dedent()
+        writer.write("}")
+        writer.write()
 
         # check_consistency method
-        cls_str += self.indent + "def _is_consistent(self) -> bool:\n"
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + '"""Check that the message follows the {} protocol."""\n'.format(
-                self.protocol_specification.name
-            )
-        )
-        cls_str += self.indent + "try:\n"
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + "assert type(self.dialogue_reference) == tuple, \"Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.\""
-            ".format(type(self.dialogue_reference))\n"
-        )
-        cls_str += (
-            self.indent
-            + "assert type(self.dialogue_reference[0]) == str, \"Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.\""
-            ".format(type(self.dialogue_reference[0]))\n"
-        )
-        cls_str += (
-            self.indent
-            + "assert type(self.dialogue_reference[1]) == str, \"Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.\""
-            ".format(type(self.dialogue_reference[1]))\n"
-        )
-        cls_str += (
-            self.indent
-            + "assert type(self.message_id) == int, \"Invalid type for 'message_id'. Expected 'int'. Found '{}'.\""
-            ".format(type(self.message_id))\n"
-        )
-        cls_str += (
-            self.indent
-            + "assert type(self.target) == int, \"Invalid type for 'target'. Expected 'int'. Found '{}'.\""
-            ".format(type(self.target))\n\n"
-        )
-
-        cls_str += self.indent + "# Light Protocol Rule 2\n"
-        cls_str += self.indent + "# Check correct performative\n"
-        cls_str += (
-            self.indent
-            + "assert type(self.performative) == {}Message.Performative".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        cls_str += (
-            ", \"Invalid 'performative'. Expected either of '{}'. Found '{}'.\".format("
-        )
-        cls_str += "self.valid_performatives, self.performative"
-        cls_str += ")\n\n"
-
-        cls_str += self.indent + "# Check correct contents\n"
-        cls_str += (
-            self.indent + "actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE\n"
-        )
-        cls_str += self.indent + "expected_nb_of_contents = 0\n"
-        counter = 1
-        for performative, contents in self._speech_acts.items():
-            if counter == 1:
-                cls_str += self.indent + "if "
-            else:
-                cls_str += self.indent + "elif "
-            cls_str += "self.performative == {}Message.Performative.{}:\n".format(
-                self.protocol_specification_in_camel_case, performative.upper(),
-            )
-            self._change_indent(1)
-            nb_of_non_optional_contents = 0
-            for content_type in contents.values():
-                if not content_type.startswith("Optional"):
-                    nb_of_non_optional_contents += 1
-
-            cls_str += self.indent + "expected_nb_of_contents = {}\n".format(
-                nb_of_non_optional_contents
-            )
-            for content_name, content_type in contents.items():
-                cls_str += self._check_content_type_str(content_name, content_type)
-            counter += 1
-            self._change_indent(-1)
-
-        cls_str += "\n"
-        cls_str += self.indent + "# Check correct content count\n"
-        cls_str += (
-            self.indent + "assert expected_nb_of_contents == actual_nb_of_contents, "
-            '"Incorrect number of contents. Expected {}. Found {}"'
-            ".format(expected_nb_of_contents, actual_nb_of_contents)\n\n"
-        )
-
-        cls_str += self.indent + "# Light Protocol Rule 3\n"
-        cls_str += self.indent + "if self.message_id == 1:\n"
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + "assert self.target == 0, \"Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.\".format(self.target)\n"
-        )
-        self._change_indent(-1)
-        cls_str += self.indent + "else:\n"
-        self._change_indent(1)
-        cls_str += (
-            self.indent + "assert 0 < self.target < self.message_id, "
-            "\"Invalid 'target'. Expected an integer between 1 and {} inclusive. Found {}.\""
-            ".format(self.message_id - 1, self.target,)\n"
-        )
-        self._change_indent(-2)
-        cls_str += self.indent + "except (AssertionError, ValueError, KeyError) as e:\n"
-        self._change_indent(1)
-        cls_str += self.indent + "logger.error(str(e))\n"
-        cls_str += self.indent + "return False\n\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "return True\n"
-
-        return cls_str
-
-    def _valid_replies_str(self):
+        writer.write("def _is_consistent(self) -> bool:")
+        writer.indent()
+        writer.write(
+            f'"""Check that the message follows the {protocol_name} protocol."""'
+        )
+        writer.write("# Light Protocol Rule 2")
+        writer.write("# Check correct performative")
+        writer.write('performative = self.get("performative")')
+        writer.write(
+            f"if not isinstance(performative, {message_class_name}.Performative):"
+        )
+        writer.indent()
+        writer.write(
+            "logger.error(\"Invalid 'performative'. Expected either of '{}'. Found '{}'.\".format(self.valid_performatives, performative))"
+        )
+        writer.write("return False")
+        writer.dedent()
+        writer.write()
+        writer.write("try:")
+        writer.indent()
+        writer.write("dialogue_reference = self.dialogue_reference")
+        writer.write("message_id = self.message_id")
+        writer.write("target = self.target")
+        writer.write(
+            "assert type(dialogue_reference) is tuple, \"Invalid type for 'dialogue_reference'. Expected 'tuple'. Found '{}'.\".format(type(dialogue_reference))"
+        )
+        writer.write(
+            "assert type(dialogue_reference[0]) is str, \"Invalid type for 'dialogue_reference[0]'. Expected 'str'. Found '{}'.\".format(type(dialogue_reference[0]))"
+        )
+        writer.write(
+            "assert type(dialogue_reference[1]) is str, \"Invalid type for 'dialogue_reference[1]'. Expected 'str'. Found '{}'.\".format(type(dialogue_reference[1]))"
+        )
+        writer.write(
+            "assert type(message_id) is int, \"Invalid type for 'message_id'. Expected 'int'. Found '{}'.\".format(type(message_id))"
+        )
+        writer.write(
+            "assert type(target) is int, \"Invalid type for 'target'. Expected 'int'. Found '{}'.\".format(type(target))"
+        )
+        writer.write()
+
+        writer.write("# Check correct contents")
+        writer.write("actual_nb_of_contents = len(self.body) - DEFAULT_BODY_SIZE")
+        writer.write(
+            "expected_nb_of_contents = self._EXPECTED_CONTENT_COUNT[performative]"
+        )
+        writer.write("expected_nb_of_contents += self._CHECKERS[performative](self)")
+        writer.write()
+        writer.write("# Check correct content count")
+        writer.write(
+            'assert expected_nb_of_contents == actual_nb_of_contents, "Incorrect number of contents. Expected {}. Found {}".format(expected_nb_of_contents, actual_nb_of_contents)'
+        )
+        writer.write()
+
+        writer.write("# Light Protocol Rule 3")
+        writer.write("if message_id == 1:")
+        writer.indent()
+        writer.write(
+            "assert target == 0, \"Invalid 'target'. Expected 0 (because 'message_id' is 1). Found {}.\".format(target)"
+        )
+        writer.dedent()
+        writer.write("else:")
+        writer.indent()
+        writer.write(
+            "assert 0 < target < message_id, \"Invalid 'target'. Expected an integer between 1 and {} inclusive. Found {}.\".format(message_id - 1, target,)"
+        )
+        writer.dedent(2)
+        writer.write("except (AssertionError, ValueError, KeyError) as e:")
+        writer.indent()
+        writer.write("logger.error(str(e))")
+        writer.write("return False")
+        writer.write()
+        writer.dedent()
+        writer.write("return True")
+
+    def _write_valid_replies(self, writer: IndentWriter) -> None:
         """
         Generate the `valid replies` dictionary.
 
-        :return: the `valid replies` dictionary string
+        :param writer: the writer to emit the dictionary into
+        :return: None
         """
-        valid_replies_str = self.indent + "VALID_REPLIES = {\n"
-        self._change_indent(1)
-        for performative in sorted(self._reply.keys()):
-            valid_replies_str += (
-                self.indent
-                + "{}Message.Performative.{}: frozenset(".format(
-                    self.protocol_specification_in_camel_case, performative.upper()
-                )
-            )
+        message_class_name = f"{self.protocol_specification_in_camel_case}Message"
+        writer.write("VALID_REPLIES = {")
+        writer.indent()
+        for performative in self._reply_performatives:
+            key = f"{message_class_name}.Performative.{performative.upper()}"
             if len(self._reply[performative]) > 0:
-                valid_replies_str += "\n"
-                self._change_indent(1)
-                valid_replies_str += self.indent + "["
-                for reply in self._reply[performative]:
-                    valid_replies_str += "{}Message.Performative.{}, ".format(
-                        self.protocol_specification_in_camel_case, reply.upper()
-                    )
-                valid_replies_str = valid_replies_str[:-2]
-                valid_replies_str += "]\n"
-                self._change_indent(-1)
-            valid_replies_str += self.indent + "),\n"
-
-        self._change_indent(-1)
-        valid_replies_str += (
-            self.indent
-            + "}}  # type: Dict[{}Message.Performative, FrozenSet[{}Message.Performative]]\n".format(
-                self.protocol_specification_in_camel_case,
-                self.protocol_specification_in_camel_case,
-            )
+                writer.write(f"{key}: frozenset(")
+                writer.indent()
+                replies = ", ".join(
+                    f"{message_class_name}.Performative.{reply.upper()}"
+                    for reply in self._reply[performative]
+                )
+                writer.write(f"[{replies}]")
+                writer.dedent()
+                writer.write("),")
+            else:
+                writer.write(f"{key}: frozenset(),")
+
+        writer.dedent()
+        writer.write(
+            f"}}  # type: Dict[{message_class_name}.Performative, FrozenSet[{message_class_name}.Performative]]"
         )
-        return valid_replies_str
 
-    def _end_state_enum_str(self) -> str:
+    def _write_end_state_enum(self, writer: IndentWriter) -> None:
         """
         Generate the end state Enum class.
 
-        :return: the end state Enum string
+        :param writer: the writer to emit the Enum class into
+        :return: None
         """
-        enum_str = self.indent + "class EndState(Dialogue.EndState):\n"
-        self._change_indent(1)
-        enum_str += (
-            self.indent
-            + '"""This class defines the end states of a {} dialogue."""\n\n'.format(
-                self.protocol_specification.name
-            )
+        writer.write("class EndState(Dialogue.EndState):")
+        writer.indent()
+        writer.write(
+            f'"""This class defines the end states of a {self.protocol_specification.name} dialogue."""'
         )
-        tag = 0
-        for end_state in self._end_states:
-            enum_str += self.indent + "{} = {}\n".format(end_state.upper(), tag)
-            tag += 1
-        self._change_indent(-1)
-        return enum_str
+        writer.write()
+        for tag, end_state in enumerate(self._end_states):
+            writer.write(f"{end_state.upper()} = {tag}")
+        writer.dedent()
 
-    def _agent_role_enum_str(self) -> str:
+    def _write_agent_role_enum(self, writer: IndentWriter) -> None:
         """
         Generate the agent role Enum class.
 
-        :return: the agent role Enum string
+        :param writer: the writer to emit the Enum class into
+        :return: None
         """
-        enum_str = self.indent + "class AgentRole(Dialogue.Role):\n"
-        self._change_indent(1)
-        enum_str += (
-            self.indent
-            + '"""This class defines the agent\'s role in a {} dialogue."""\n\n'.format(
-                self.protocol_specification.name
-            )
+        writer.write("class AgentRole(Dialogue.Role):")
+        writer.indent()
+        writer.write(
+            f'"""This class defines the agent\'s role in a {self.protocol_specification.name} dialogue."""'
         )
+        writer.write()
         for role in self._roles:
-            enum_str += self.indent + '{} = "{}"\n'.format(role.upper(), role)
-        self._change_indent(-1)
-        return enum_str
+            writer.write(f'{role.upper()} = "{role}"')
+        writer.dedent()
 
-    def _dialogue_class_str(self) -> str:
+    def _write_dialogues_module(self, writer: IndentWriter) -> None:
         """
-        Produce the content of the Message class.
+        Write the content of the dialogues module.
 
-        :return: the message.py file content
+        :param writer: the writer to emit the dialogues.py content into
+        :return: None
         """
-        self._change_indent(0, "s")
+        protocol_name = self.protocol_specification.name
+        protocol_name_in_camel_case = self.protocol_specification_in_camel_case
+        message_class_name = f"{protocol_name_in_camel_case}Message"
+        dialogue_class_name = f"{protocol_name_in_camel_case}Dialogue"
 
         # Header
-        cls_str = _copyright_header_str(self.protocol_specification.author) + "\n"
+        writer.write_raw(_copyright_header_str(self.protocol_specification.author))
+        writer.write()
 
         # Module docstring
-        cls_str += self.indent + '"""\n'
-        cls_str += (
-            self.indent
-            + "This module contains the classes required for {} dialogue management.\n\n".format(
-                self.protocol_specification.name
-            )
+        writer.write('"""')
+        writer.write(
+            f"This module contains the classes required for {protocol_name} dialogue management."
         )
-        cls_str += (
-            self.indent
-            + "- DialogueLabel: The dialogue label class acts as an identifier for dialogues.\n"
+        writer.write()
+        writer.write(
+            "- DialogueLabel: The dialogue label class acts as an identifier for dialogues."
         )
-        cls_str += (
-            self.indent
-            + "- Dialogue: The dialogue class maintains state of a dialogue and manages it.\n"
+        writer.write(
+            "- Dialogue: The dialogue class maintains state of a dialogue and manages it."
         )
-        cls_str += (
-            self.indent
-            + "- Dialogues: The dialogues class keeps track of all dialogues.\n"
-        )
-        cls_str += self.indent + '"""\n\n'
+        writer.write("- Dialogues: The dialogues class keeps track of all dialogues.")
+        writer.write('"""')
+        writer.write()
 
         # Imports
-        cls_str += self.indent + "from abc import ABC\n"
-        cls_str += self.indent + "from enum import Enum\n"
-        cls_str += self.indent + "from typing import Dict, FrozenSet, cast\n\n"
-        cls_str += (
-            self.indent
-            + "from aea.helpers.dialogue.base import Dialogue, DialogueLabel, Dialogues\n"
+        writer.write("from abc import ABC")
+        writer.write("from enum import Enum")
+        writer.write("from typing import Dict, FrozenSet, cast")
+        writer.write()
+        writer.write(
+            "from aea.helpers.dialogue.base import Dialogue, DialogueLabel, Dialogues"
         )
-        cls_str += self.indent + "from aea.mail.base import Address\n"
-        cls_str += self.indent + "from aea.protocols.base import Message\n\n"
-        cls_str += self.indent + "from {}.message import {}Message\n".format(
-            self.path_to_protocol_package, self.protocol_specification_in_camel_case,
+        writer.write("from aea.mail.base import Address")
+        writer.write("from aea.protocols.base import Message")
+        writer.write()
+        writer.write(
+            f"from {self.path_to_protocol_package}.message import {message_class_name}"
         )
 
         # Constants
-        cls_str += self.indent + "\n"
-        cls_str += self.indent + self._valid_replies_str()
-        cls_str += self.indent + "\n"
+        writer.write()
+        self._write_valid_replies(writer)
+        writer.write()
 
         # Class Header
-        cls_str += "\nclass {}Dialogue(Dialogue):\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + '"""The {} dialogue class maintains state of a dialogue and manages it."""\n'.format(
-                self.protocol_specification.name
-            )
+        writer.write()
+        writer.write(f"class {dialogue_class_name}(Dialogue):")
+        writer.indent()
+        writer.write(
+            f'"""The {protocol_name} dialogue class maintains state of a dialogue and manages it."""'
         )
 
         # Enums
-        cls_str += "\n" + self._agent_role_enum_str()
-        cls_str += "\n" + self._end_state_enum_str()
-        cls_str += "\n"
+        writer.write()
+        self._write_agent_role_enum(writer)
+        writer.write()
+        self._write_end_state_enum(writer)
+        writer.write()
 
         # is_valid method
-        cls_str += self.indent + "def is_valid(self, message: Message) -> bool:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += (
-            self.indent
-            + "Check whether 'message' is a valid next message in the dialogue.\n\n"
-        )
-        cls_str += (
-            self.indent
-            + "These rules capture specific constraints designed for dialogues which are instances of a concrete sub-class of this class.\n"
-        )
-        cls_str += (
-            self.indent
-            + "Override this method with your additional dialogue rules.\n\n"
-        )
-        cls_str += self.indent + ":param message: the message to be validated\n"
-        cls_str += self.indent + ":return: True if valid, False otherwise\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "return True\n\n"
-        self._change_indent(-1)
+        writer.write("def is_valid(self, message: Message) -> bool:")
+        writer.indent()
+        writer.write('"""')
+        writer.write("Check whether 'message' is a valid next message in the dialogue.")
+        writer.write()
+        writer.write(
+            "These rules capture specific constraints designed for dialogues which are instances of a concrete sub-class of this class."
+        )
+        writer.write("Override this method with your additional dialogue rules.")
+        writer.write()
+        writer.write(":param message: the message to be validated")
+        writer.write(":return: True if valid, False otherwise")
+        writer.write('"""')
+        writer.write("return True")
+        writer.write()
+        writer.dedent()
 
         # initial_performative method
-        cls_str += (
-            self.indent
-            + "def initial_performative(self) -> {}Message.Performative:\n".format(
-                self.protocol_specification_in_camel_case
-            )
+        writer.write(
+            f"def initial_performative(self) -> {message_class_name}.Performative:"
         )
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += (
-            self.indent
-            + "Get the performative which the initial message in the dialogue must have.\n\n"
+        writer.indent()
+        writer.write('"""')
+        writer.write(
+            "Get the performative which the initial message in the dialogue must have."
         )
-        cls_str += self.indent + ":return: the performative of the initial message\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "return {}Message.Performative.{}\n\n".format(
-            self.protocol_specification_in_camel_case, self._initial_performative
+        writer.write()
+        writer.write(":return: the performative of the initial message")
+        writer.write('"""')
+        writer.write(
+            f"return {message_class_name}.Performative.{self._initial_performative}"
         )
-        self._change_indent(-1)
+        writer.write()
+        writer.dedent()
 
         # get_replies method
-        cls_str += (
-            self.indent + "def get_replies(self, performative: Enum) -> FrozenSet:\n"
-        )
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += (
-            self.indent
-            + "Given a 'performative', return the list of performatives which are its valid replies in a {} dialogue\n\n".format(
-                self.protocol_specification.name
-            )
-        )
-        cls_str += self.indent + ":param performative: the performative in a message\n"
-        cls_str += self.indent + ":return: list of valid performative replies\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += (
-            self.indent
-            + "performative = cast({}Message.Performative, performative)\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        cls_str += (
-            self.indent
-            + "assert performative in VALID_REPLIES, \"this performative '{}' is not supported\".format(performative)\n"
-        )
-        cls_str += self.indent + "return VALID_REPLIES[performative]\n\n"
-        self._change_indent(-2)
-        cls_str += self.indent + "\n"
+        writer.write("def get_replies(self, performative: Enum) -> FrozenSet:")
+        writer.indent()
+        writer.write('"""')
+        writer.write(
+            f"Given a 'performative', return the list of performatives which are its valid replies in a {protocol_name} dialogue"
+        )
+        writer.write()
+        writer.write(":param performative: the performative in a message")
+        writer.write(":return: list of valid performative replies")
+        writer.write('"""')
+        writer.write(
+            f"performative = cast({message_class_name}.Performative, performative)"
+        )
+        writer.write(
+            "assert performative in VALID_REPLIES, \"this performative '{}' is not supported\".format(performative)"
+        )
+        writer.write("return VALID_REPLIES[performative]")
+        writer.write()
+        writer.dedent(2)
+        writer.write()
 
         # stats class
-        cls_str += self.indent + "class {}DialogueStats(object):\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + '"""Class to handle statistics on {} dialogues."""\n\n'.format(
-                self.protocol_specification.name
-            )
-        )
-        cls_str += self.indent + "def __init__(self) -> None:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""Initialize a StatsManager."""\n'
-        cls_str += self.indent + "self._self_initiated = {\n"
-        self._change_indent(1)
-        for end_state in self._end_states:
-            cls_str += self.indent + "{}Dialogue.EndState.{}: 0,\n".format(
-                self.protocol_specification_in_camel_case, end_state.upper()
-            )
-        self._change_indent(-1)
-        cls_str += self.indent + "}}  # type: Dict[{}Dialogue.EndState, int]\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        cls_str += self.indent + "self._other_initiated = {\n"
-        self._change_indent(1)
-        for end_state in self._end_states:
-            cls_str += self.indent + "{}Dialogue.EndState.{}: 0,\n".format(
-                self.protocol_specification_in_camel_case, end_state.upper()
-            )
-        self._change_indent(-1)
-        cls_str += (
-            self.indent
-            + "}}  # type: Dict[{}Dialogue.EndState, int]\n\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        self._change_indent(-1)
-        cls_str += self.indent + "@property\n"
-        cls_str += (
-            self.indent
-            + "def self_initiated(self) -> Dict[{}Dialogue.EndState, int]:\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + '"""Get the stats dictionary on self initiated dialogues."""\n'
-        )
-        cls_str += self.indent + "return self._self_initiated\n\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "@property\n"
-        cls_str += (
-            self.indent
-            + "def other_initiated(self) -> Dict[{}Dialogue.EndState, int]:\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + '"""Get the stats dictionary on other initiated dialogues."""\n'
-        )
-        cls_str += self.indent + "return self._other_initiated\n\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "def add_dialogue_endstate(\n"
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + "self, end_state: {}Dialogue.EndState, is_self_initiated: bool\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        self._change_indent(-1)
-        cls_str += self.indent + ") -> None:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Add dialogue endstate stats.\n\n"
-        cls_str += self.indent + ":param end_state: the end state of the dialogue\n"
-        cls_str += (
-            self.indent
-            + ":param is_self_initiated: whether the dialogue is initiated by the agent or the opponent\n\n"
-        )
-        cls_str += self.indent + ":return: None\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "if is_self_initiated:\n"
-        self._change_indent(1)
-        cls_str += self.indent + "self._self_initiated[end_state] += 1\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "else:\n"
-        self._change_indent(1)
-        cls_str += self.indent + "self._other_initiated[end_state] += 1\n"
-        self._change_indent(-3)
-        cls_str += self.indent + "\n\n"
+        writer.write(f"class {dialogue_class_name}Stats(object):")
+        writer.indent()
+        writer.write(f'"""Class to handle statistics on {protocol_name} dialogues."""')
+        writer.write()
+        writer.write("def __init__(self) -> None:")
+        writer.indent()
+        writer.write('"""Initialize a StatsManager."""')
+        end_states = ", ".join(
+            f"{dialogue_class_name}.EndState.{end_state.upper()}"
+            for end_state in self._end_states
+        )
+        for stats_attribute in ("_self_initiated", "_other_initiated"):
+            writer.write(
+                f"self.{stats_attribute} = dict.fromkeys([{end_states}], 0)  # type: Dict[{dialogue_class_name}.EndState, int]"
+            )
+        writer.write()
+        writer.dedent()
+        _write_property(
+            writer,
+            "self_initiated",
+            f"Dict[{dialogue_class_name}.EndState, int]",
+            "Get the stats dictionary on self initiated dialogues.",
+        )
+        _write_property(
+            writer,
+            "other_initiated",
+            f"Dict[{dialogue_class_name}.EndState, int]",
+            "Get the stats dictionary on other initiated dialogues.",
+        )
+        writer.write("def add_dialogue_endstate(")
+        writer.indent()
+        writer.write(
+            f"self, end_state: {dialogue_class_name}.EndState, is_self_initiated: bool"
+        )
+        writer.dedent()
+        writer.write(") -> None:")
+        writer.indent()
+        writer.write('"""')
+        writer.write("Add dialogue endstate stats.")
+        writer.write()
+        writer.write(":param end_state: the end state of the dialogue")
+        writer.write(
+            ":param is_self_initiated: whether the dialogue is initiated by the agent or the opponent"
+        )
+        writer.write()
+        writer.write(":return: None")
+        writer.write('"""')
+        writer.write("if is_self_initiated:")
+        writer.indent()
+        writer.write("self._self_initiated[end_state] += 1")
+        writer.dedent()
+        writer.write("else:")
+        writer.indent()
+        writer.write("self._other_initiated[end_state] += 1")
+        writer.dedent(3)
+        writer.write()
+        writer.write()
 
         # dialogues class
-        cls_str += self.indent + "class {}Dialogues(Dialogues, ABC):\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + '"""This class keeps track of all {} dialogues."""\n\n'.format(
-                self.protocol_specification.name
-            )
-        )
-        cls_str += self.indent + "def __init__(self, agent_address: Address) -> None:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Initialize dialogues.\n\n"
-        cls_str += (
-            self.indent
-            + ":param agent_address: the address of the agent for whom dialogues are maintained\n"
-        )
-        cls_str += self.indent + ":return: None\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += (
-            self.indent + "Dialogues.__init__(self, agent_address=agent_address)\n"
-        )
-        cls_str += self.indent + "self._dialogue_stats = {}DialogueStats()\n\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(-1)
-        cls_str += self.indent + "@property\n"
-        cls_str += (
-            self.indent
-            + "def dialogue_stats(self) -> {}DialogueStats:\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Get the dialogue statistics.\n\n"
-        cls_str += self.indent + ":return: dialogue stats object\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "return self._dialogue_stats\n\n"
-        self._change_indent(-1)
-        cls_str += self.indent + "def create_dialogue(\n"
-        cls_str += (
-            self.indent
-            + self.indent
-            + "self, dialogue_label: DialogueLabel, role: Dialogue.Role,\n"
-        )
-        cls_str += self.indent + ") -> {}Dialogue:\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Create an instance of fipa dialogue.\n\n"
-        cls_str += (
-            self.indent + ":param dialogue_label: the identifier of the dialogue\n"
-        )
-        cls_str += (
-            self.indent
-            + ":param role: the role of the agent this dialogue is maintained for\n\n"
+        writer.write(f"class {dialogue_class_name}s(Dialogues, ABC):")
+        writer.indent()
+        writer.write(f'"""This class keeps track of all {protocol_name} dialogues."""')
+        writer.write()
+        writer.write_raw(
+            DIALOGUES_METHODS_TEMPLATE.substitute(dialogue_class=dialogue_class_name)
         )
-        cls_str += self.indent + ":return: the created dialogue\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "dialogue = {}Dialogue(\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        cls_str += (
-            self.indent
-            + self.indent
-            + "dialogue_label=dialogue_label, agent_address=self.agent_address, role=role\n"
-        )
-        cls_str += self.indent + ")\n"
-        cls_str += self.indent + "return dialogue\n"
-        self._change_indent(-2)
-        cls_str += self.indent + "\n"
+        writer.dedent()
 
-        return cls_str
+    def _write_custom_types_module(self, writer: IndentWriter) -> None:
+        """
+        Write the custom_types module, containing classes corresponding to every custom type in the protocol specification.
 
-    def _custom_types_module_str(self) -> str:
+        :param writer: the writer to emit the custom_types.py content into
+        :return: None
         """
-        Produces the contents of the custom_types module, containing classes corresponding to every custom type in the protocol specification.
+        writer.write_raw(
+            _custom_types_module_str(
+                self.protocol_specification.author, tuple(self._all_custom_types)
+            )
+        )
 
-        :return: the custom_types.py file content
+    def _encoding_message_content_from_python_to_protobuf(
+        self, content_name: str, content_type: str, writer: IndentWriter,
+    ) -> None:
         """
-        self._change_indent(0, "s")
+        Produce the encoding of message contents for the serialisation class.
 
-        # Header
-        cls_str = _copyright_header_str(self.protocol_specification.author) + "\n"
+        :param content_name: the name of the content to be encoded
+        :param content_type: the type of the content to be encoded
+        :param writer: the writer the encoding is written to
+        :return: None
+        """
+        encode_content = self._content_encoders.get(_get_type_prefix(content_type))
+        if encode_content is not None:
+            encode_content(content_name, content_type, writer)
+            return
+        writer.write(f"{content_name} = msg.{content_name}")
+        if content_type in PYTHON_TYPES_WITH_PROTO_TYPE:
+            writer.write(f"performative.{content_name} = {content_name}")
+        else:
+            writer.write(
+                f"{content_type}.encode(performative.{content_name}, {content_name})"
+            )
 
-        # Module docstring
-        cls_str += '"""This module contains class representations corresponding to every custom type in the protocol specification."""\n'
+    def _encode_repeated_content(
+        self, content_name: str, content_type: str, writer: IndentWriter,
+    ) -> None:
+        """
+        Produce the encoding of a frozenset or tuple content.
 
-        if len(self._all_custom_types) == 0:
-            return cls_str
+        :param content_name: the name of the content to be encoded
+        :param content_type: the type of the content to be encoded
+        :param writer: the writer the encoding is written to
+        :return: None
+        """
+        writer.write(f"{content_name} = msg.{content_name}")
+        writer.write(f"performative.{content_name}.extend({content_name})")
 
-        # class code per custom type
-        for custom_type in self._all_custom_types:
-            cls_str += self.indent + "\n\nclass {}:\n".format(custom_type)
-            self._change_indent(1)
-            cls_str += (
-                self.indent
-                + '"""This class represents an instance of {}."""\n\n'.format(
-                    custom_type
-                )
-            )
-            cls_str += self.indent + "def __init__(self):\n"
-            self._change_indent(1)
-            cls_str += self.indent + '"""Initialise an instance of {}."""\n'.format(
-                custom_type
-            )
-            cls_str += self.indent + "raise NotImplementedError\n\n"
-            self._change_indent(-1)
-            cls_str += self.indent + "@staticmethod\n"
-            cls_str += (
-                self.indent
-                + 'def encode({}_protobuf_object, {}_object: "{}") -> None:\n'.format(
-                    _camel_case_to_snake_case(custom_type),
-                    _camel_case_to_snake_case(custom_type),
-                    custom_type,
-                )
-            )
-            self._change_indent(1)
-            cls_str += self.indent + '"""\n'
-            cls_str += (
-                self.indent
-                + "Encode an instance of this class into the protocol buffer object.\n\n"
-            )
-            cls_str += (
-                self.indent
-                + "The protocol buffer object in the {}_protobuf_object argument must be matched with the instance of this class in the '{}_object' argument.\n\n".format(
-                    _camel_case_to_snake_case(custom_type),
-                    _camel_case_to_snake_case(custom_type),
-                )
-            )
-            cls_str += (
-                self.indent
-                + ":param {}_protobuf_object: the protocol buffer object whose type corresponds with this class.\n".format(
-                    _camel_case_to_snake_case(custom_type)
-                )
-            )
-            cls_str += (
-                self.indent
-                + ":param {}_object: an instance of this class to be encoded in the protocol buffer object.\n".format(
-                    _camel_case_to_snake_case(custom_type)
-                )
-            )
-            cls_str += self.indent + ":return: None\n"
-            cls_str += self.indent + '"""\n'
-            cls_str += self.indent + "raise NotImplementedError\n\n"
-            self._change_indent(-1)
-
-            cls_str += self.indent + "@classmethod\n"
-            cls_str += (
-                self.indent
-                + 'def decode(cls, {}_protobuf_object) -> "{}":\n'.format(
-                    _camel_case_to_snake_case(custom_type), custom_type,
-                )
-            )
-            self._change_indent(1)
-            cls_str += self.indent + '"""\n'
-            cls_str += (
-                self.indent
-                + "Decode a protocol buffer object that corresponds with this class into an instance of this class.\n\n"
-            )
-            cls_str += (
-                self.indent
-                + "A new instance of this class must be created that matches the protocol buffer object in the '{}_protobuf_object' argument.\n\n".format(
-                    _camel_case_to_snake_case(custom_type)
-                )
-            )
-            cls_str += (
-                self.indent
-                + ":param {}_protobuf_object: the protocol buffer object whose type corresponds with this class.\n".format(
-                    _camel_case_to_snake_case(custom_type)
-                )
-            )
-            cls_str += (
-                self.indent
-                + ":return: A new instance of this class that matches the protocol buffer object in the '{}_protobuf_object' argument.\n".format(
-                    _camel_case_to_snake_case(custom_type)
-                )
-            )
-            cls_str += self.indent + '"""\n'
-            cls_str += self.indent + "raise NotImplementedError\n\n"
-            self._change_indent(-1)
+    def _encode_map_content(
+        self, content_name: str, content_type: str, writer: IndentWriter,
+    ) -> None:
+        """
+        Produce the encoding of a dictionary content.
 
-            cls_str += self.indent + "def __eq__(self, other):\n"
-            self._change_indent(1)
-            cls_str += self.indent + "raise NotImplementedError\n"
-            self._change_indent(-2)
-        return cls_str
+        :param content_name: the name of the content to be encoded
+        :param content_type: the type of the content to be encoded
+        :param writer: the writer the encoding is written to
+        :return: None
+        """
+        writer.write(f"{content_name} = msg.{content_name}")
+        writer.write(f"performative.{content_name}.update({content_name})")
 
-    def _encoding_message_content_from_python_to_protobuf(
-        self, content_name: str, content_type: str,
-    ) -> str:
+    def _encode_union_content(
+        self, content_name: str, content_type: str, writer: IndentWriter,
+    ) -> None:
         """
-        Produce the encoding of message contents for the serialisation class.
+        Produce the encoding of a union content, one branch per sub-type.
 
         :param content_name: the name of the content to be encoded
         :param content_type: the type of the content to be encoded
-        :return: the encoding string
+        :param writer: the writer the encoding is written to
+        :return: None
         """
-        encoding_str = ""
-        if content_type in PYTHON_TYPE_TO_PROTO_TYPE.keys():
-            encoding_str += self.indent + "{} = msg.{}\n".format(
-                content_name, content_name
-            )
-            encoding_str += self.indent + "performative.{} = {}\n".format(
-                content_name, content_name
-            )
-        elif content_type.startswith("FrozenSet") or content_type.startswith("Tuple"):
-            encoding_str += self.indent + "{} = msg.{}\n".format(
-                content_name, content_name
-            )
-            encoding_str += self.indent + "performative.{}.extend({})\n".format(
-                content_name, content_name
-            )
-        elif content_type.startswith("Dict"):
-            encoding_str += self.indent + "{} = msg.{}\n".format(
-                content_name, content_name
-            )
-            encoding_str += self.indent + "performative.{}.update({})\n".format(
-                content_name, content_name
-            )
-        elif content_type.startswith("Union"):
-            sub_types = _get_sub_types_of_compositional_types(content_type)
-            for sub_type in sub_types:
-                sub_type_name_in_protobuf = _union_sub_type_to_protobuf_variable_name(
-                    content_name, sub_type
-                )
-                encoding_str += self.indent + 'if msg.is_set("{}"):\n'.format(
-                    sub_type_name_in_protobuf
-                )
-                self._change_indent(1)
-                encoding_str += self.indent + "performative.{}_is_set = True\n".format(
-                    sub_type_name_in_protobuf
-                )
-                encoding_str += self._encoding_message_content_from_python_to_protobuf(
-                    sub_type_name_in_protobuf, sub_type
-                )
-                self._change_indent(-1)
-        elif content_type.startswith("Optional"):
-            sub_type = _get_sub_types_of_compositional_types(content_type)[0]
-            if not sub_type.startswith("Union"):
-                encoding_str += self.indent + 'if msg.is_set("{}"):\n'.format(
-                    content_name
-                )
-                self._change_indent(1)
-                encoding_str += self.indent + "performative.{}_is_set = True\n".format(
-                    content_name
-                )
-            encoding_str += self._encoding_message_content_from_python_to_protobuf(
+        for sub_type in _get_sub_types_of_compositional_types(content_type):
+            sub_type_name_in_protobuf = _union_sub_type_to_protobuf_variable_name(
                 content_name, sub_type
             )
-            if not sub_type.startswith("Union"):
-                self._change_indent(-1)
-        else:
-            encoding_str += self.indent + "{} = msg.{}\n".format(
-                content_name, content_name
-            )
-            encoding_str += self.indent + "{}.encode(performative.{}, {})\n".format(
-                content_type, content_name, content_name
+            writer.write(f'if msg.is_set("{sub_type_name_in_protobuf}"):')
+            writer.indent()
+            writer.write(f"performative.{sub_type_name_in_protobuf}_is_set = True")
+            self._encoding_message_content_from_python_to_protobuf(
+                sub_type_name_in_protobuf, sub_type, writer
             )
-        return encoding_str
+            writer.dedent()
+
+    def _encode_optional_content(
+        self, content_name: str, content_type: str, writer: IndentWriter,
+    ) -> None:
+        """
+        Produce the encoding of an optional content.
+
+        :param content_name: the name of the content to be encoded
+        :param content_type: the type of the content to be encoded
+        :param writer: the writer the encoding is written to
+        :return: None
+        """
+        sub_type = _get_sub_types_of_compositional_types(content_type)[0]
+        if not sub_type.startswith("Union"):
+            writer.write(f'if msg.is_set("{content_name}"):')
+            writer.indent()
+            writer.write(f"performative.{content_name}_is_set = True")
+        self._encoding_message_content_from_python_to_protobuf(
+            content_name, sub_type, writer
+        )
+        if not sub_type.startswith("Union"):
+            writer.dedent()
 
     def _decoding_message_content_from_protobuf_to_python(
         self,
         performative: str,
         content_name: str,
         content_type: str,
+        writer: IndentWriter,
         variable_name_in_protobuf: Optional[str] = "",
-    ) -> str:
+    ) -> None:
         """
         Produce the decoding of message contents for the serialisation class.
 
         :param performative: the performative to which the content belongs
         :param content_name: the name of the content to be decoded
         :param content_type: the type of the content to be decoded
-        :param no_indents: the number of indents based on the previous sections of the code
-        :return: the decoding string
-        """
-        decoding_str = ""
-        variable_name = (
-            content_name
-            if variable_name_in_protobuf == ""
-            else variable_name_in_protobuf
-        )
-        if content_type in PYTHON_TYPE_TO_PROTO_TYPE.keys():
-            decoding_str += self.indent + "{} = {}_pb.{}.{}\n".format(
-                content_name,
-                self.protocol_specification.name,
-                performative,
-                variable_name,
-            )
-            decoding_str += self.indent + 'performative_content["{}"] = {}\n'.format(
-                content_name, content_name
-            )
-        elif content_type.startswith("FrozenSet"):
-            decoding_str += self.indent + "{} = {}_pb.{}.{}\n".format(
-                content_name,
-                self.protocol_specification.name,
-                performative,
-                content_name,
-            )
-            decoding_str += self.indent + "{}_frozenset = frozenset({})\n".format(
-                content_name, content_name
-            )
-            decoding_str += (
-                self.indent
-                + 'performative_content["{}"] = {}_frozenset\n'.format(
-                    content_name, content_name
-                )
-            )
-        elif content_type.startswith("Tuple"):
-            decoding_str += self.indent + "{} = {}_pb.{}.{}\n".format(
-                content_name,
-                self.protocol_specification.name,
-                performative,
-                content_name,
-            )
-            decoding_str += self.indent + "{}_tuple = tuple({})\n".format(
-                content_name, content_name
-            )
-            decoding_str += (
-                self.indent
-                + 'performative_content["{}"] = {}_tuple\n'.format(
-                    content_name, content_name
-                )
-            )
-        elif content_type.startswith("Dict"):
-            decoding_str += self.indent + "{} = {}_pb.{}.{}\n".format(
-                content_name,
-                self.protocol_specification.name,
-                performative,
-                content_name,
-            )
-            decoding_str += self.indent + "{}_dict = dict({})\n".format(
-                content_name, content_name
+        :param writer: the writer the decoding is written to
+        :param variable_name_in_protobuf: the name of the content's variable in the protobuf message, if different from content_name
+        :return: None
+        """
+        variable_name = variable_name_in_protobuf or content_name
+        decode_content = self._content_decoders.get(_get_type_prefix(content_type))
+        if decode_content is not None:
+            decode_content(
+                performative, content_name, content_type, writer, variable_name,
+            )
+            return
+        protocol_name = self.protocol_specification.name
+        if content_type in PYTHON_TYPES_WITH_PROTO_TYPE:
+            writer.write(
+                f"{content_name} = {protocol_name}_pb.{performative}.{variable_name}"
             )
-            decoding_str += (
-                self.indent
-                + 'performative_content["{}"] = {}_dict\n'.format(
-                    content_name, content_name
-                )
+        else:
+            writer.write(
+                f"pb2_{variable_name} = {protocol_name}_pb.{performative}.{variable_name}"
             )
-        elif content_type.startswith("Union"):
-            sub_types = _get_sub_types_of_compositional_types(content_type)
-            for sub_type in sub_types:
-                sub_type_name_in_protobuf = _union_sub_type_to_protobuf_variable_name(
-                    content_name, sub_type
-                )
-                decoding_str += self.indent + "if {}_pb.{}.{}_is_set:\n".format(
-                    self.protocol_specification.name,
-                    performative,
-                    sub_type_name_in_protobuf,
-                )
-                self._change_indent(1)
-                decoding_str += self._decoding_message_content_from_protobuf_to_python(
-                    performative=performative,
-                    content_name=content_name,
-                    content_type=sub_type,
-                    variable_name_in_protobuf=sub_type_name_in_protobuf,
-                )
-                self._change_indent(-1)
-        elif content_type.startswith("Optional"):
-            sub_type = _get_sub_types_of_compositional_types(content_type)[0]
-            if not sub_type.startswith("Union"):
-                decoding_str += self.indent + "if {}_pb.{}.{}_is_set:\n".format(
-                    self.protocol_specification.name, performative, content_name
-                )
-                self._change_indent(1)
-                # no_indents += 1
-            decoding_str += self._decoding_message_content_from_protobuf_to_python(
-                performative, content_name, sub_type
+            writer.write(f"{content_name} = {content_type}.decode(pb2_{variable_name})")
+        writer.write(f'performative_content["{content_name}"] = {content_name}')
+
+    def _decode_container_content(
+        self,
+        performative: str,
+        content_name: str,
+        content_type: str,
+        writer: IndentWriter,
+        variable_name: str,
+    ) -> None:
+        """
+        Produce the decoding of a frozenset, tuple or dictionary content.
+
+        :param performative: the performative to which the content belongs
+        :param content_name: the name of the content to be decoded
+        :param content_type: the type of the content to be decoded
+        :param writer: the writer the decoding is written to
+        :param variable_name: the name of the content's variable in the protobuf message
+        :return: None
+        """
+        container_type = UNION_CONTAINER_TYPES[_get_type_prefix(content_type)]
+        writer.write(
+            f"{content_name} = {self.protocol_specification.name}_pb.{performative}.{content_name}"
+        )
+        writer.write(
+            f"{content_name}_{container_type} = {container_type}({content_name})"
+        )
+        writer.write(
+            f'performative_content["{content_name}"] = {content_name}_{container_type}'
+        )
+
+    def _decode_union_content(
+        self,
+        performative: str,
+        content_name: str,
+        content_type: str,
+        writer: IndentWriter,
+        variable_name: str,
+    ) -> None:
+        """
+        Produce the decoding of a union content, one branch per sub-type.
+
+        :param performative: the performative to which the content belongs
+        :param content_name: the name of the content to be decoded
+        :param content_type: the type of the content to be decoded
+        :param writer: the writer the decoding is written to
+        :param variable_name: the name of the content's variable in the protobuf message
+        :return: None
+        """
+        for sub_type in _get_sub_types_of_compositional_types(content_type):
+            sub_type_name_in_protobuf = _union_sub_type_to_protobuf_variable_name(
+                content_name, sub_type
             )
-            if not sub_type.startswith("Union"):
-                self._change_indent(-1)
-        else:
-            decoding_str += self.indent + "pb2_{} = {}_pb.{}.{}\n".format(
-                variable_name,
-                self.protocol_specification.name,
-                performative,
-                variable_name,
+            writer.write(
+                f"if {self.protocol_specification.name}_pb.{performative}.{sub_type_name_in_protobuf}_is_set:"
             )
-            decoding_str += self.indent + "{} = {}.decode(pb2_{})\n".format(
-                content_name, content_type, variable_name,
+            writer.indent()
+            self._decoding_message_content_from_protobuf_to_python(
+                performative=performative,
+                content_name=content_name,
+                content_type=sub_type,
+                writer=writer,
+                variable_name_in_protobuf=sub_type_name_in_protobuf,
             )
-            decoding_str += self.indent + 'performative_content["{}"] = {}\n'.format(
-                content_name, content_name
+            writer.dedent()
+
+    def _decode_optional_content(
+        self,
+        performative: str,
+        content_name: str,
+        content_type: str,
+        writer: IndentWriter,
+        variable_name: str,
+    ) -> None:
+        """
+        Produce the decoding of an optional content.
+
+        :param performative: the performative to which the content belongs
+        :param content_name: the name of the content to be decoded
+        :param content_type: the type of the content to be decoded
+        :param writer: the writer the decoding is written to
+        :param variable_name: the name of the content's variable in the protobuf message
+        :return: None
+        """
+        sub_type = _get_sub_types_of_compositional_types(content_type)[0]
+        if not sub_type.startswith("Union"):
+            writer.write(
+                f"if {self.protocol_specification.name}_pb.{performative}.{content_name}_is_set:"
             )
-        return decoding_str
+            writer.indent()
+        self._decoding_message_content_from_protobuf_to_python(
+            performative, content_name, sub_type, writer
+        )
+        if not sub_type.startswith("Union"):
+            writer.dedent()
 
     def _to_custom_custom(self, content_type: str) -> str:
         """
-        Evaluate whether a content type is a custom type or has a custom type as a sub-type.
-        :return: Boolean result
+        Replace the custom types in a content type with their "CustomXXX" equivalents.
+
+        Results are cached in self._custom_custom_content_types.
+
+        :param content_type: the content type
+        :return: the content type with "CustomXXX" custom types
         """
+        new_content_type = self._custom_custom_content_types.get(content_type)
+        if new_content_type is not None:
+            return new_content_type
         new_content_type = content_type
-        if _includes_custom_type(content_type):
+        if self._all_custom_types and _includes_custom_type(content_type):
             for custom_type in self._all_custom_types:
                 new_content_type = new_content_type.replace(
                     custom_type, self._custom_custom_types[custom_type]
                 )
+        self._custom_custom_content_types[content_type] = new_content_type
         return new_content_type
 
-    def _serialization_class_str(self) -> str:
+    def _write_serialization_module(self, writer: IndentWriter) -> None:
         """
-        Produce the content of the Serialization class.
+        Write the content of the Serialization class.
 
-        :return: the serialization.py file content
+        :param writer: the writer to emit the serialization.py content into
+        :return: None
         """
-        self._change_indent(0, "s")
+        protocol_name = self.protocol_specification.name
+        protocol_name_in_camel_case = self.protocol_specification_in_camel_case
 
         # Header
-        cls_str = _copyright_header_str(self.protocol_specification.author) + "\n"
+        writer.write_raw(_copyright_header_str(self.protocol_specification.author))
+        writer.write()
 
         # Module docstring
-        cls_str += (
-            self.indent
-            + '"""Serialization module for {} protocol."""\n\n'.format(
-                self.protocol_specification.name
-            )
-        )
+        writer.write(f'"""Serialization module for {protocol_name} protocol."""')
+        writer.write()
 
         # Imports
-        cls_str += self.indent + "from typing import Any, Dict, cast\n\n"
-        cls_str += MESSAGE_IMPORT + "\n"
-        cls_str += SERIALIZER_IMPORT + "\n\n"
-        cls_str += self.indent + "from {} import (\n    {}_pb2,\n)\n".format(
-            self.path_to_protocol_package, self.protocol_specification.name,
+        writer.write("from typing import Any, Dict, cast")
+        writer.write()
+        writer.write(MESSAGE_IMPORT)
+        writer.write(SERIALIZER_IMPORT)
+        writer.write()
+        writer.write(
+            f"from {self.path_to_protocol_package} import (\n    {protocol_name}_pb2,\n)"
         )
         for custom_type in self._all_custom_types:
-            cls_str += (
-                self.indent
-                + "from {}.custom_types import (\n    {},\n)\n".format(
-                    self.path_to_protocol_package, custom_type,
-                )
+            writer.write(
+                f"from {self.path_to_protocol_package}.custom_types import (\n    {custom_type},\n)"
             )
-        cls_str += self.indent + "from {}.message import (\n    {}Message,\n)\n".format(
-            self.path_to_protocol_package, self.protocol_specification_in_camel_case,
+        writer.write(
+            f"from {self.path_to_protocol_package}.message import (\n    {protocol_name_in_camel_case}Message,\n)"
         )
 
         # Class Header
-        cls_str += self.indent + "\n\nclass {}Serializer(Serializer):\n".format(
-            self.protocol_specification_in_camel_case,
-        )
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + '"""Serialization for the \'{}\' protocol."""\n\n'.format(
-                self.protocol_specification.name,
-            )
-        )
+        writer.write()
+        writer.write()
+        writer.write(f"class {protocol_name_in_camel_case}Serializer(Serializer):")
+        writer.indent()
+        writer.write(f'"""Serialization for the \'{protocol_name}\' protocol."""')
+        writer.write()
 
         # encoder
-        cls_str += self.indent + "def encode(self, msg: Message) -> bytes:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Encode a '{}' message into bytes.\n\n".format(
-            self.protocol_specification_in_camel_case,
-        )
-        cls_str += self.indent + ":param msg: the message object.\n"
-        cls_str += self.indent + ":return: the bytes.\n"
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "msg = cast({}Message, msg)\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        cls_str += self.indent + "{}_msg = {}_pb2.{}Message()\n".format(
-            self.protocol_specification.name,
-            self.protocol_specification.name,
-            self.protocol_specification_in_camel_case,
-        )
-        cls_str += self.indent + "{}_msg.message_id = msg.message_id\n".format(
-            self.protocol_specification.name
-        )
-        cls_str += self.indent + "dialogue_reference = msg.dialogue_reference\n"
-        cls_str += (
-            self.indent
-            + "{}_msg.dialogue_starter_reference = dialogue_reference[0]\n".format(
-                self.protocol_specification.name
-            )
-        )
-        cls_str += (
-            self.indent
-            + "{}_msg.dialogue_responder_reference = dialogue_reference[1]\n".format(
-                self.protocol_specification.name
-            )
-        )
-        cls_str += self.indent + "{}_msg.target = msg.target\n\n".format(
-            self.protocol_specification.name
-        )
-        cls_str += self.indent + "performative_id = msg.performative\n"
-        counter = 1
-        for performative, contents in self._speech_acts.items():
-            if counter == 1:
-                cls_str += self.indent + "if "
-            else:
-                cls_str += self.indent + "elif "
-            cls_str += "performative_id == {}Message.Performative.{}:\n".format(
-                self.protocol_specification_in_camel_case, performative.upper()
+        writer.write("def encode(self, msg: Message) -> bytes:")
+        writer.indent()
+        writer.write('"""')
+        writer.write(f"Encode a '{protocol_name_in_camel_case}' message into bytes.")
+        writer.write()
+        writer.write(":param msg: the message object.")
+        writer.write(":return: the bytes.")
+        writer.write('"""')
+        writer.write(f"msg = cast({protocol_name_in_camel_case}Message, msg)")
+        writer.write(
+            f"{protocol_name}_msg = {protocol_name}_pb2.{protocol_name_in_camel_case}Message()"
+        )
+        writer.write(f"{protocol_name}_msg.message_id = msg.message_id")
+        writer.write("dialogue_reference = msg.dialogue_reference")
+        writer.write(
+            f"{protocol_name}_msg.dialogue_starter_reference = dialogue_reference[0]"
+        )
+        writer.write(
+            f"{protocol_name}_msg.dialogue_responder_reference = dialogue_reference[1]"
+        )
+        writer.write(f"{protocol_name}_msg.target = msg.target")
+        writer.write()
+        writer.write("performative_id = msg.performative")
+        for i, (performative, title_case, upper_case, contents) in enumerate(
+            self._speech_acts_entries
+        ):
+            keyword = "if" if i == 0 else "elif"
+            writer.write(
+                f"{keyword} performative_id == {protocol_name_in_camel_case}Message.Performative.{upper_case}:"
             )
-            self._change_indent(1)
-            cls_str += (
-                self.indent
-                + "performative = {}_pb2.{}Message.{}_Performative()  # type: ignore\n".format(
-                    self.protocol_specification.name,
-                    self.protocol_specification_in_camel_case,
-                    performative.title(),
-                )
+            writer.indent()
+            writer.write(
+                f"performative = {protocol_name}_pb2.{protocol_name_in_camel_case}Message.{title_case}_Performative()  # type: ignore"
             )
             for content_name, content_type in contents.items():
-                cls_str += self._encoding_message_content_from_python_to_protobuf(
-                    content_name, content_type
+                self._encoding_message_content_from_python_to_protobuf(
+                    content_name, content_type, writer
                 )
-            cls_str += self.indent + "{}_msg.{}.CopyFrom(performative)\n".format(
-                self.protocol_specification.name, performative
-            )
-
-            counter += 1
-            self._change_indent(-1)
-        cls_str += self.indent + "else:\n"
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + 'raise ValueError("Performative not valid: {}".format(performative_id))\n\n'
+            writer.write(f"{protocol_name}_msg.{performative}.CopyFrom(performative)")
+            writer.dedent()
+        writer.write("else:")
+        writer.indent()
+        writer.write(
+            'raise ValueError("Performative not valid: {}".format(performative_id))'
         )
-        self._change_indent(-1)
+        writer.write()
+        writer.dedent()
 
-        cls_str += self.indent + "{}_bytes = {}_msg.SerializeToString()\n".format(
-            self.protocol_specification.name, self.protocol_specification.name
-        )
-        cls_str += self.indent + "return {}_bytes\n\n".format(
-            self.protocol_specification.name
-        )
-        self._change_indent(-1)
+        writer.write(f"{protocol_name}_bytes = {protocol_name}_msg.SerializeToString()")
+        writer.write(f"return {protocol_name}_bytes")
+        writer.write()
+        writer.dedent()
 
         # decoder
-        cls_str += self.indent + "def decode(self, obj: bytes) -> Message:\n"
-        self._change_indent(1)
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "Decode bytes into a '{}' message.\n\n".format(
-            self.protocol_specification_in_camel_case,
-        )
-        cls_str += self.indent + ":param obj: the bytes object.\n"
-        cls_str += self.indent + ":return: the '{}' message.\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        cls_str += self.indent + '"""\n'
-        cls_str += self.indent + "{}_pb = {}_pb2.{}Message()\n".format(
-            self.protocol_specification.name,
-            self.protocol_specification.name,
-            self.protocol_specification_in_camel_case,
-        )
-        cls_str += self.indent + "{}_pb.ParseFromString(obj)\n".format(
-            self.protocol_specification.name
-        )
-        cls_str += self.indent + "message_id = {}_pb.message_id\n".format(
-            self.protocol_specification.name
-        )
-        cls_str += (
-            self.indent
-            + "dialogue_reference = ({}_pb.dialogue_starter_reference, {}_pb.dialogue_responder_reference)\n".format(
-                self.protocol_specification.name, self.protocol_specification.name
-            )
-        )
-        cls_str += self.indent + "target = {}_pb.target\n\n".format(
-            self.protocol_specification.name
-        )
-        cls_str += (
-            self.indent
-            + 'performative = {}_pb.WhichOneof("performative")\n'.format(
-                self.protocol_specification.name
-            )
-        )
-        cls_str += (
-            self.indent
-            + "performative_id = {}Message.Performative(str(performative))\n".format(
-                self.protocol_specification_in_camel_case
-            )
-        )
-        cls_str += (
-            self.indent + "performative_content = dict()  # type: Dict[str, Any]\n"
-        )
-        counter = 1
-        for performative, contents in self._speech_acts.items():
-            if counter == 1:
-                cls_str += self.indent + "if "
-            else:
-                cls_str += self.indent + "elif "
-            cls_str += "performative_id == {}Message.Performative.{}:\n".format(
-                self.protocol_specification_in_camel_case, performative.upper()
+        writer.write("def decode(self, obj: bytes) -> Message:")
+        writer.indent()
+        writer.write('"""')
+        writer.write(f"Decode bytes into a '{protocol_name_in_camel_case}' message.")
+        writer.write()
+        writer.write(":param obj: the bytes object.")
+        writer.write(f":return: the '{protocol_name_in_camel_case}' message.")
+        writer.write('"""')
+        writer.write(
+            f"{protocol_name}_pb = {protocol_name}_pb2.{protocol_name_in_camel_case}Message()"
+        )
+        writer.write(f"{protocol_name}_pb.ParseFromString(obj)")
+        writer.write(f"message_id = {protocol_name}_pb.message_id")
+        writer.write(
+            f"dialogue_reference = ({protocol_name}_pb.dialogue_starter_reference, {protocol_name}_pb.dialogue_responder_reference)"
+        )
+        writer.write(f"target = {protocol_name}_pb.target")
+        writer.write()
+        writer.write(f'performative = {protocol_name}_pb.WhichOneof("performative")')
+        writer.write(
+            f"performative_id = {protocol_name_in_camel_case}Message.Performative(str(performative))"
+        )
+        writer.write("performative_content = dict()  # type: Dict[str, Any]")
+        for i, (performative, _, upper_case, contents) in enumerate(
+            self._speech_acts_entries
+        ):
+            keyword = "if" if i == 0 else "elif"
+            writer.write(
+                f"{keyword} performative_id == {protocol_name_in_camel_case}Message.Performative.{upper_case}:"
             )
-            self._change_indent(1)
+            writer.indent()
             if len(contents.keys()) == 0:
-                cls_str += self.indent + "pass\n"
+                writer.write("pass")
             else:
                 for content_name, content_type in contents.items():
-                    cls_str += self._decoding_message_content_from_protobuf_to_python(
-                        performative, content_name, content_type
+                    self._decoding_message_content_from_protobuf_to_python(
+                        performative, content_name, content_type, writer
                     )
-            counter += 1
-            self._change_indent(-1)
-        cls_str += self.indent + "else:\n"
-        self._change_indent(1)
-        cls_str += (
-            self.indent
-            + 'raise ValueError("Performative not valid: {}.".format(performative_id))\n\n'
-        )
-        self._change_indent(-1)
-
-        cls_str += self.indent + "return {}Message(\n".format(
-            self.protocol_specification_in_camel_case,
-        )
-        self._change_indent(1)
-        cls_str += self.indent + "message_id=message_id,\n"
-        cls_str += self.indent + "dialogue_reference=dialogue_reference,\n"
-        cls_str += self.indent + "target=target,\n"
-        cls_str += self.indent + "performative=performative,\n"
-        cls_str += self.indent + "**performative_content\n"
-        self._change_indent(-1)
-        cls_str += self.indent + ")\n"
-        self._change_indent(-2)
+            writer.dedent()
+        writer.write("else:")
+        writer.indent()
+        writer.write(
+            'raise ValueError("Performative not valid: {}.".format(performative_id))'
+        )
+        writer.write()
+        writer.dedent()
+
+        writer.write(f"return {protocol_name_in_camel_case}Message(")
+        writer.indent()
+        writer.write("message_id=message_id,")
+        writer.write("dialogue_reference=dialogue_reference,")
+        writer.write("target=target,")
+        writer.write("performative=performative,")
+        writer.write("**performative_content")
+        writer.dedent()
+        writer.write(")")
+        writer.dedent(2)
+
+    def _write_content_proto_field(
+        self, writer: IndentWriter, content_name: str, content_type: str, tag_no: int,
+    ) -> int:
+        """
+        Write the representation of a message content in a protocol buffer schema.
 
-        return cls_str
+        :param writer: the writer to emit the field(s) into
+        :param content_name: the name of the content
+        :param content_type: the type of the content
+        :param tag_no: the tag number of the (first) field
+        :return: the tag number following the fields written
+        """
+        write_proto_fields = self._content_proto_fields.get(
+            _get_type_prefix(content_type)
+        )
+        if write_proto_fields is not None:
+            return write_proto_fields(writer, content_name, content_type, tag_no)
+        # it is a <CT> or <PT>
+        proto_type = _python_pt_or_ct_type_to_proto_type(content_type)
+        writer.write(f"{proto_type} {content_name} = {tag_no};")
+        return tag_no + 1
+
+    def _write_repeated_proto_field(
+        self, writer: IndentWriter, content_name: str, content_type: str, tag_no: int,
+    ) -> int:
+        """
+        Write the protocol buffer field of a <PCT> content.
 
-    def _content_to_proto_field_str(
-        self, content_name: str, content_type: str, tag_no: int,
-    ) -> Tuple[str, int]:
+        :param writer: the writer to emit the field into
+        :param content_name: the name of the content
+        :param content_type: the type of the content
+        :param tag_no: the tag number of the field
+        :return: the tag number following the field
+        """
+        element_type = _get_sub_types_of_compositional_types(content_type)[0]
+        proto_type = _python_pt_or_ct_type_to_proto_type(element_type)
+        writer.write(f"repeated {proto_type} {content_name} = {tag_no};")
+        return tag_no + 1
+
+    def _write_map_proto_field(
+        self, writer: IndentWriter, content_name: str, content_type: str, tag_no: int,
+    ) -> int:
         """
-        Convert a message content to its representation in a protocol buffer schema.
+        Write the protocol buffer field of a <PMT> content.
 
+        :param writer: the writer to emit the field into
         :param content_name: the name of the content
         :param content_type: the type of the content
-        :param content_type: the tag number
-        :return: the content in protocol buffer schema
+        :param tag_no: the tag number of the field
+        :return: the tag number following the field
         """
-        entry = ""
+        key_type, value_type = _get_sub_types_of_compositional_types(content_type)
+        proto_key_type = _python_pt_or_ct_type_to_proto_type(key_type)
+        proto_value_type = _python_pt_or_ct_type_to_proto_type(value_type)
+        writer.write(
+            f"map<{proto_key_type}, {proto_value_type}> {content_name} = {tag_no};"
+        )
+        return tag_no + 1
 
-        if content_type.startswith("FrozenSet") or content_type.startswith(
-            "Tuple"
-        ):  # it is a <PCT>
-            element_type = _get_sub_types_of_compositional_types(content_type)[0]
-            proto_type = _python_pt_or_ct_type_to_proto_type(element_type)
-            entry = self.indent + "repeated {} {} = {};\n".format(
-                proto_type, content_name, tag_no
-            )
-            tag_no += 1
-        elif content_type.startswith("Dict"):  # it is a <PMT>
-            key_type = _get_sub_types_of_compositional_types(content_type)[0]
-            value_type = _get_sub_types_of_compositional_types(content_type)[1]
-            proto_key_type = _python_pt_or_ct_type_to_proto_type(key_type)
-            proto_value_type = _python_pt_or_ct_type_to_proto_type(value_type)
-            entry = self.indent + "map<{}, {}> {} = {};\n".format(
-                proto_key_type, proto_value_type, content_name, tag_no
-            )
-            tag_no += 1
-        elif content_type.startswith("Union"):  # it is an <MT>
-            sub_types = _get_sub_types_of_compositional_types(content_type)
-            for sub_type in sub_types:
-                sub_type_name = _union_sub_type_to_protobuf_variable_name(
-                    content_name, sub_type
-                )
-                content_to_proto_field_str, tag_no = self._content_to_proto_field_str(
-                    sub_type_name, sub_type, tag_no
-                )
-                entry += content_to_proto_field_str
-        elif content_type.startswith("Optional"):  # it is an <O>
-            sub_type = _get_sub_types_of_compositional_types(content_type)[0]
-            content_to_proto_field_str, tag_no = self._content_to_proto_field_str(
-                content_name, sub_type, tag_no
+    def _write_union_proto_fields(
+        self, writer: IndentWriter, content_name: str, content_type: str, tag_no: int,
+    ) -> int:
+        """
+        Write the protocol buffer fields of an <MT> content, one per sub-type.
+
+        :param writer: the writer to emit the fields into
+        :param content_name: the name of the content
+        :param content_type: the type of the content
+        :param tag_no: the tag number of the first field
+        :return: the tag number following the fields
+        """
+        for sub_type in _get_sub_types_of_compositional_types(content_type):
+            sub_type_name = _union_sub_type_to_protobuf_variable_name(
+                content_name, sub_type
             )
-            entry = content_to_proto_field_str
-            entry += self.indent + "bool {}_is_set = {};\n".format(content_name, tag_no)
-            tag_no += 1
-        else:  # it is a <CT> or <PT>
-            proto_type = _python_pt_or_ct_type_to_proto_type(content_type)
-            entry = self.indent + "{} {} = {};\n".format(
-                proto_type, content_name, tag_no
+            tag_no = self._write_content_proto_field(
+                writer, sub_type_name, sub_type, tag_no
             )
-            tag_no += 1
-        return entry, tag_no
+        return tag_no
+
+    def _write_optional_proto_fields(
+        self, writer: IndentWriter, content_name: str, content_type: str, tag_no: int,
+    ) -> int:
+        """
+        Write the protocol buffer fields of an <O> content and its "is set" flag.
 
-    def _protocol_buffer_schema_str(self) -> str:
+        :param writer: the writer to emit the fields into
+        :param content_name: the name of the content
+        :param content_type: the type of the content
+        :param tag_no: the tag number of the first field
+        :return: the tag number following the fields
         """
-        Produce the content of the Protocol Buffers schema.
+        sub_type = _get_sub_types_of_compositional_types(content_type)[0]
+        tag_no = self._write_content_proto_field(writer, content_name, sub_type, tag_no)
+        writer.write(f"bool {content_name}_is_set = {tag_no};")
+        return tag_no + 1
 
-        :return: the protocol buffers schema content
+    def _write_protocol_buffer_schema(self, writer: IndentWriter) -> None:
         """
-        self._change_indent(0, "s")
+        Write the content of the Protocol Buffers schema.
+
+        :param writer: the writer to emit the protocol buffers schema content into
+        :return: None
+        """
+        protocol_name_in_camel_case = self.protocol_specification_in_camel_case
 
         # heading
-        proto_buff_schema_str = self.indent + 'syntax = "proto3";\n\n'
-        proto_buff_schema_str += self.indent + "package fetch.aea.{};\n\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        proto_buff_schema_str += self.indent + "message {}Message{{\n\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        self._change_indent(1)
+        writer.write('syntax = "proto3";')
+        writer.write()
+        writer.write(f"package fetch.aea.{protocol_name_in_camel_case};")
+        writer.write()
+        writer.write(f"message {protocol_name_in_camel_case}Message{{")
+        writer.write()
+        writer.indent()
 
         # custom types
         if (
@@ -2313,131 +2270,108 @@ class ProtocolGenerator:
             and (self.protocol_specification.protobuf_snippets is not None)
             and (self.protocol_specification.protobuf_snippets != "")
         ):
-            proto_buff_schema_str += self.indent + "// Custom Types\n"
+            writer.write("// Custom Types")
             for custom_type in self._all_custom_types:
-                proto_buff_schema_str += self.indent + "message {}{{\n".format(
-                    custom_type
-                )
-                self._change_indent(1)
+                writer.write(f"message {custom_type}{{")
+                writer.indent()
 
-                # formatting and adding the custom type protobuf entry
-                specification_custom_type = "ct:" + custom_type
+                # adding the custom type protobuf entry, line by line
                 proto_part = self.protocol_specification.protobuf_snippets[
-                    specification_custom_type
+                    "ct:" + custom_type
                 ]
-                number_of_new_lines = proto_part.count("\n")
-                if number_of_new_lines != 0:
-                    formatted_proto_part = proto_part.replace(
-                        "\n", "\n" + self.indent, number_of_new_lines - 1
-                    )
-                else:
-                    formatted_proto_part = proto_part
-                proto_buff_schema_str += self.indent + formatted_proto_part
-                self._change_indent(-1)
+                for proto_line in proto_part.splitlines():
+                    writer.write(proto_line)
+                writer.dedent()
 
-                proto_buff_schema_str += self.indent + "}\n\n"
-            proto_buff_schema_str += "\n"
+                writer.write("}")
+                writer.write()
+            writer.write()
 
         # performatives
-        proto_buff_schema_str += self.indent + "// Performatives and contents\n"
-        for performative, contents in self._speech_acts.items():
-            proto_buff_schema_str += self.indent + "message {}_Performative{{".format(
-                performative.title()
-            )
-            self._change_indent(1)
-            tag_no = 1
+        writer.write("// Performatives and contents")
+        for _, title_case, _, contents in self._speech_acts_entries:
             if len(contents) == 0:
-                proto_buff_schema_str += "}\n\n"
-                self._change_indent(-1)
+                writer.write(f"message {title_case}_Performative{{}}")
             else:
-                proto_buff_schema_str += "\n"
+                writer.write(f"message {title_case}_Performative{{")
+                writer.indent()
+                tag_no = 1
                 for content_name, content_type in contents.items():
-                    (
-                        content_to_proto_field_str,
-                        tag_no,
-                    ) = self._content_to_proto_field_str(
-                        content_name, content_type, tag_no
+                    tag_no = self._write_content_proto_field(
+                        writer, content_name, content_type, tag_no
                     )
-                    proto_buff_schema_str += content_to_proto_field_str
-                self._change_indent(-1)
-                proto_buff_schema_str += self.indent + "}\n\n"
-        proto_buff_schema_str += "\n"
-        # self._change_indent(-1)
+                writer.dedent()
+                writer.write("}")
+            writer.write()
+        writer.write()
 
         # meta-data
-        proto_buff_schema_str += self.indent + "// Standard {}Message fields\n".format(
-            self.protocol_specification_in_camel_case
-        )
-        proto_buff_schema_str += self.indent + "int32 message_id = 1;\n"
-        proto_buff_schema_str += (
-            self.indent + "string dialogue_starter_reference = 2;\n"
-        )
-        proto_buff_schema_str += (
-            self.indent + "string dialogue_responder_reference = 3;\n"
-        )
-        proto_buff_schema_str += self.indent + "int32 target = 4;\n"
-        proto_buff_schema_str += self.indent + "oneof performative{\n"
-        self._change_indent(1)
-        tag_no = 5
-        for performative in self._all_performatives:
-            proto_buff_schema_str += self.indent + "{}_Performative {} = {};\n".format(
-                performative.title(), performative, tag_no
-            )
-            tag_no += 1
-        self._change_indent(-1)
-        proto_buff_schema_str += self.indent + "}\n"
-        self._change_indent(-1)
-
-        proto_buff_schema_str += self.indent + "}\n"
-        return proto_buff_schema_str
-
-    def _protocol_yaml_str(self) -> str:
+        writer.write(f"// Standard {protocol_name_in_camel_case}Message fields")
+        writer.write("int32 message_id = 1;")
+        writer.write("string dialogue_starter_reference = 2;")
+        writer.write("string dialogue_responder_reference = 3;")
+        writer.write("int32 target = 4;")
+        writer.write("oneof performative{")
+        writer.indent()
+        for tag_no, performative in enumerate(self._all_performatives, start=5):
+            writer.write(
+                f"{performative.title()}_Performative {performative} = {tag_no};"
+            )
+        writer.dedent()
+        writer.write("}")
+        writer.dedent()
+
+        writer.write("}")
+
+    def _write_protocol_yaml(self, writer: IndentWriter) -> None:
         """
-        Produce the content of the protocol.yaml file.
+        Write the content of the protocol.yaml file.
 
-        :return: the protocol.yaml content
+        :param writer: the writer to emit the protocol.yaml content into
+        :return: None
         """
-        protocol_yaml_str = "name: {}\n".format(self.protocol_specification.name)
-        protocol_yaml_str += "author: {}\n".format(self.protocol_specification.author)
-        protocol_yaml_str += "version: {}\n".format(self.protocol_specification.version)
-        protocol_yaml_str += "description: {}\n".format(
-            self.protocol_specification.description
-        )
-        protocol_yaml_str += "license: {}\n".format(self.protocol_specification.license)
-        protocol_yaml_str += "aea_version: '{}'\n".format(
-            self.protocol_specification.aea_version
-        )
-        protocol_yaml_str += "fingerprint: {}\n"
-        protocol_yaml_str += "fingerprint_ignore_patterns: []\n"
-        protocol_yaml_str += "dependencies:\n"
-        protocol_yaml_str += "    protobuf: {}\n"
-
-        return protocol_yaml_str
-
-    def _init_str(self) -> str:
+        writer.write(f"name: {self.protocol_specification.name}")
+        writer.write(f"author: {self.protocol_specification.author}")
+        writer.write(f"version: {self.protocol_specification.version}")
+        writer.write(f"description: {self.protocol_specification.description}")
+        writer.write(f"license: {self.protocol_specification.license}")
+        writer.write(f"aea_version: '{self.protocol_specification.aea_version}'")
+        writer.write("fingerprint: {}")
+        writer.write("fingerprint_ignore_patterns: []")
+        writer.write("dependencies:")
+        writer.indent()
+        writer.write("protobuf: {}")
+        writer.dedent()
+
+    def _write_init_module(self, writer: IndentWriter) -> None:
         """
-        Produce the content of the __init__.py file.
+        Write the content of the __init__.py file.
 
-        :return: the __init__.py content
+        :param writer: the writer to emit the __init__.py content into
+        :return: None
         """
-        init_str = _copyright_header_str(self.protocol_specification.author)
-        init_str += "\n"
-        init_str += '"""This module contains the support resources for the {} protocol."""\n'.format(
-            self.protocol_specification.name
+        writer.write_raw(_copyright_header_str(self.protocol_specification.author))
+        writer.write()
+        writer.write(
+            f'"""This module contains the support resources for the {self.protocol_specification.name} protocol."""'
         )
 
-        return init_str
-
-    def _generate_file(self, file_name: str, file_content: str) -> None:
+    def _generate_file(
+        self, file_name: str, write_content: Callable[[IndentWriter], None]
+    ) -> None:
         """
         Create a protocol file.
 
+        :param file_name: the name of the file
+        :param write_content: the method emitting the content of the file
         :return: None
         """
+        writer = IndentWriter()
+        write_content(writer)
         pathname = path.join(self.output_folder_path, file_name)
 
         with open(pathname, "w") as file:
-            file.write(file_content)
+            writer.write_to(file)
 
     def generate(self) -> None:
         """
@@ -2450,39 +2384,54 @@ class ProtocolGenerator:
         if not output_folder.exists():
             os.mkdir(output_folder)
 
-        # Generate the protocol files
-        self._generate_file(INIT_FILE_NAME, self._init_str())
-        self._generate_file(PROTOCOL_YAML_FILE_NAME, self._protocol_yaml_str())
-        self._generate_file(MESSAGE_DOT_PY_FILE_NAME, self._message_class_str())
-        if (
-            self.protocol_specification.dialogue_config is not None
-            and self.protocol_specification.dialogue_config != {}
-        ):
-            self._generate_file(DIALOGUE_DOT_PY_FILE_NAME, self._dialogue_class_str())
-        if len(self._all_custom_types) > 0:
+        # Generate the protobuf schema first and compile it while the python modules are generated
+        protocol_name = self.protocol_specification.name
+        proto_file_name = f"{protocol_name}.proto"
+        self._generate_file(proto_file_name, self._write_protocol_buffer_schema)
+        protoc_process = None  # type: Optional[subprocess.Popen]
+        protoc_returncode = 0
+        try:
+            protoc_process = subprocess.Popen(  # nosec
+                [
+                    "protoc",
+                    f"-I={self.output_folder_path}",
+                    f"--python_out={self.output_folder_path}",
+                    f"{self.output_folder_path}/{proto_file_name}",
+                ]
+            )
+        except FileNotFoundError:
+            logger.error(
+                f"Cannot compile '{proto_file_name}': 'protoc' was not found. Install the protocol buffer compiler and compile it manually."
+            )
+
+        try:
+            # Generate the protocol files
+            self._generate_file(INIT_FILE_NAME, self._write_init_module)
+            self._generate_file(PROTOCOL_YAML_FILE_NAME, self._write_protocol_yaml)
+            self._generate_file(MESSAGE_DOT_PY_FILE_NAME, self._write_message_module)
+            if (
+                self.protocol_specification.dialogue_config is not None
+                and self.protocol_specification.dialogue_config != {}
+            ):
+                self._generate_file(
+                    DIALOGUE_DOT_PY_FILE_NAME, self._write_dialogues_module
+                )
+            if len(self._all_custom_types) > 0:
+                self._generate_file(
+                    CUSTOM_TYPES_DOT_PY_FILE_NAME, self._write_custom_types_module
+                )
             self._generate_file(
-                CUSTOM_TYPES_DOT_PY_FILE_NAME, self._custom_types_module_str()
+                SERIALIZATION_DOT_PY_FILE_NAME, self._write_serialization_module
             )
-        self._generate_file(
-            SERIALIZATION_DOT_PY_FILE_NAME, self._serialization_class_str()
-        )
-        self._generate_file(
-            "{}.proto".format(self.protocol_specification.name),
-            self._protocol_buffer_schema_str(),
-        )
+        finally:
+            # Wait for the protobuf schema compilation, also when generating a module failed
+            if protoc_process is not None:
+                protoc_returncode = protoc_process.wait()
 
         # Warn if specification has custom types
         if len(self._all_custom_types) > 0:
-            incomplete_generation_warning_msg = "The generated protocol is incomplete, because the protocol specification contains the following custom types: {}. Update the generated '{}' file with the appropriate implementations of these custom types.".format(
-                self._all_custom_types, CUSTOM_TYPES_DOT_PY_FILE_NAME
-            )
+            incomplete_generation_warning_msg = f"The generated protocol is incomplete, because the protocol specification contains the following custom types: {self._all_custom_types}. Update the generated '{CUSTOM_TYPES_DOT_PY_FILE_NAME}' file with the appropriate implementations of these custom types."
             logger.warning(incomplete_generation_warning_msg)
 
-        # Compile protobuf schema
-        cmd = "protoc -I={} --python_out={} {}/{}.proto".format(
-            self.output_folder_path,
-            self.output_folder_path,
-            self.output_folder_path,
-            self.protocol_specification.name,
-        )
-        os.system(cmd)  # nosec
+        if protoc_process is not None and protoc_returncode != 0:
+            raise subprocess.CalledProcessError(protoc_returncode, protoc_process.args)
@@ -101,7 +101,7 @@ class GetAddressTestCase(TestCase):
         _try_get_address(ctx, "type")
 
 
-@mock.patch("builtins.open", mock.mock_open())
+@mock.patch("aea.cli.core.open", mock.mock_open(), create=True)
 class AddKeyTestCase(TestCase):
     """Test case for _add_key method."""
 
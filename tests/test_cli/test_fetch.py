@@ -18,6 +18,7 @@
 # ------------------------------------------------------------------------------
 """This test module contains the tests for CLI Registry fetch methods."""
 
+from contextlib import ExitStack
 from unittest import TestCase, mock
 
 from click import ClickException
@@ -34,13 +35,24 @@ def _raise_click_exception(*args, **kwargs):
     raise ClickException("Message")
 
 
-@mock.patch("builtins.open", mock.mock_open())
-@mock.patch("aea.cli.fetch.os.path.join", return_value="joined-path")
-@mock.patch("aea.cli.fetch.try_get_item_source_path", return_value="path")
-@mock.patch("aea.cli.fetch.try_to_load_agent_config")
 class FetchAgentLocallyTestCase(TestCase):
     """Test case for fetch_agent_locally method."""
 
+    def setUp(self):
+        """Set the patches shared by the tests up."""
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        stack.enter_context(
+            mock.patch("aea.cli.fetch.open", mock.mock_open(), create=True)
+        )
+        stack.enter_context(
+            mock.patch("aea.cli.fetch.os.path.join", return_value="joined-path")
+        )
+        stack.enter_context(
+            mock.patch("aea.cli.fetch.try_get_item_source_path", return_value="path")
+        )
+        stack.enter_context(mock.patch("aea.cli.fetch.try_to_load_agent_config"))
+
     @mock.patch("aea.cli.fetch._is_version_correct", return_value=True)
     @mock.patch("aea.cli.fetch.os.path.exists", return_value=False)
     @mock.patch("aea.cli.fetch.copy_tree")
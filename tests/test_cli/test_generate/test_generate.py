@@ -44,7 +44,7 @@ def _raise_psperror(*args, **kwargs):
     raise ProtocolSpecificationParseError()
 
 
-@mock.patch("builtins.open", mock.mock_open())
+@mock.patch("aea.cli.generate.open", mock.mock_open(), create=True)
 @mock.patch("aea.cli.generate.ConfigLoader")
 @mock.patch("aea.cli.generate.os.path.join", return_value="joined-path")
 class GenerateItemTestCase(TestCase):
@@ -19,6 +19,7 @@
 """Test module for Registry push methods."""
 
 import os
+from contextlib import ExitStack
 from unittest import TestCase, mock
 
 from click import ClickException
@@ -30,36 +31,41 @@ from tests.test_cli.tools_for_testing import ContextMock, PublicIdMock
 from ...conftest import AUTHOR
 
 
-@mock.patch("aea.cli.registry.push.check_is_author_logged_in")
-@mock.patch("aea.cli.registry.utils._rm_tarfiles")
-@mock.patch("aea.cli.registry.push.os.getcwd", return_value="cwd")
-@mock.patch("aea.cli.registry.push._compress_dir")
-@mock.patch(
-    "aea.cli.registry.push.load_yaml",
-    return_value={
-        "description": "some-description",
-        "version": "some-version",
-        "author": AUTHOR,
-        "protocols": ["protocol_id"],
-    },
-)
-@mock.patch(
-    "aea.cli.registry.push.request_api", return_value={"public_id": "public-id"}
-)
 class PushItemTestCase(TestCase):
     """Test case for push_item method."""
 
+    def setUp(self):
+        """Set the patches shared by the tests up."""
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        stack.enter_context(
+            mock.patch("aea.cli.registry.push.check_is_author_logged_in")
+        )
+        stack.enter_context(mock.patch("aea.cli.registry.utils._rm_tarfiles"))
+        stack.enter_context(
+            mock.patch("aea.cli.registry.push.os.getcwd", return_value="cwd")
+        )
+        stack.enter_context(mock.patch("aea.cli.registry.push._compress_dir"))
+        stack.enter_context(
+            mock.patch(
+                "aea.cli.registry.push.load_yaml",
+                return_value={
+                    "description": "some-description",
+                    "version": "some-version",
+                    "author": AUTHOR,
+                    "protocols": ["protocol_id"],
+                },
+            )
+        )
+        self.request_api_mock = stack.enter_context(
+            mock.patch(
+                "aea.cli.registry.push.request_api",
+                return_value={"public_id": "public-id"},
+            )
+        )
+
     @mock.patch("aea.cli.registry.push.os.path.exists", return_value=True)
-    def test_push_item_positive(
-        self,
-        path_exists_mock,
-        request_api_mock,
-        load_yaml_mock,
-        compress_mock,
-        getcwd_mock,
-        rm_tarfiles_mock,
-        check_is_author_logged_in_mock,
-    ):
+    def test_push_item_positive(self, path_exists_mock):
         """Test for push_item positive result."""
         public_id = PublicIdMock(
             name="some-name",
@@ -67,7 +73,7 @@ class PushItemTestCase(TestCase):
             version="{}".format(PublicIdMock.DEFAULT_VERSION),
         )
         push_item(ContextMock(), "some-type", public_id)
-        request_api_mock.assert_called_once_with(
+        self.request_api_mock.assert_called_once_with(
             "POST",
             "/some-types/create",
             data={
@@ -81,21 +87,12 @@ class PushItemTestCase(TestCase):
         )
 
     @mock.patch("aea.cli.registry.push.os.path.exists", return_value=False)
-    def test_push_item_item_not_found(
-        self,
-        path_exists_mock,
-        request_api_mock,
-        load_yaml_mock,
-        compress_mock,
-        getcwd_mock,
-        rm_tarfiles_mock,
-        check_is_author_logged_in_mock,
-    ):
+    def test_push_item_item_not_found(self, path_exists_mock):
         """Test for push_item - item not found."""
         with self.assertRaises(ClickException):
             push_item(ContextMock(), "some-type", PublicIdMock())
 
-        request_api_mock.assert_not_called()
+        self.request_api_mock.assert_not_called()
 
 
 @mock.patch("aea.cli.registry.push.shutil.rmtree")
@@ -175,7 +175,7 @@ class RequestAPITestCase(TestCase):
         result = request_api("GET", "/path", is_auth=True)
         self.assertEqual(result, expected_result)
 
-    @mock.patch("builtins.open", mock.mock_open())
+    @mock.patch("aea.cli.registry.utils.open", mock.mock_open(), create=True)
     def test_request_api_with_file_positive(self, request_mock):
         """Test for request_api method with file positive result."""
         expected_result = {"correct": "json"}
@@ -203,7 +203,7 @@ class RequestAPINoResponseTestCase(TestCase):
 class DownloadFileTestCase(TestCase):
     """Test case for download_file method."""
 
-    @mock.patch("builtins.open", mock.mock_open())
+    @mock.patch("aea.cli.registry.utils.open", mock.mock_open(), create=True)
     def test_download_file_positive(self, get_mock):
         """Test for download_file method positive result."""
         filename = "filename.tar.gz"
@@ -154,7 +154,7 @@ class InitConfigFolderTestCase(TestCase):
 
 @mock.patch("aea.cli.utils.config.get_or_create_cli_config")
 @mock.patch("aea.cli.utils.package_utils.yaml.dump")
-@mock.patch("builtins.open", mock.mock_open())
+@mock.patch("aea.cli.utils.config.open", mock.mock_open(), create=True)
 class UpdateCLIConfigTestCase(TestCase):
     """Test case for update_cli_config method."""
 
@@ -19,11 +19,11 @@
 
 """This test module contains the tests for the stub connection."""
 
+import asyncio
 import base64
 import os
 import shutil
 import tempfile
-import time
 from pathlib import Path
 from unittest import mock
 
@@ -36,108 +36,42 @@ from aea.mail.base import Envelope, Multiplexer
 from aea.protocols.default.message import DefaultMessage
 from aea.protocols.default.serialization import DefaultSerializer
 
+from ..common.utils import wait_for_condition
 from ..conftest import _make_stub_connection
 
+DEFAULT_SERIALIZER = DefaultSerializer()
 SEPARATOR = ","
+ENCODED_SEPARATOR = SEPARATOR.encode("utf-8")
+DEFAULT_ENVELOPE_PREFIX = ENCODED_SEPARATOR.join(
+    (b"any", b"any", str(DefaultMessage.protocol_id).encode("utf-8"), b"")
+)
+
+
+def _encode_envelope(
+    to: str, sender: str, protocol_id: PublicId, message: bytes
+) -> bytes:
+    """Encode the envelope fields as a line of the stub connection's input file."""
+    fields = (
+        to.encode("utf-8"),
+        sender.encode("utf-8"),
+        str(protocol_id).encode("utf-8"),
+        message,
+    )
+    return ENCODED_SEPARATOR.join(fields) + ENCODED_SEPARATOR
+
+
+def _append_to_file(path: Path, data: bytes) -> None:
+    """Append the data to the file with a single unbuffered write."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_APPEND)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 
 class TestStubConnectionReception:
     """Test that the stub connection is implemented correctly."""
 
-    @classmethod
-    def setup_class(cls):
-        """Set the test up."""
-        cls.cwd = os.getcwd()
-        cls.tmpdir = Path(tempfile.mkdtemp())
-        d = cls.tmpdir / "test_stub"
-        d.mkdir(parents=True)
-        cls.input_file_path = d / "input_file.csv"
-        cls.output_file_path = d / "output_file.csv"
-        cls.connection = _make_stub_connection(
-            cls.input_file_path, cls.output_file_path
-        )
-
-        cls.multiplexer = Multiplexer([cls.connection])
-        cls.multiplexer.connect()
-        os.chdir(cls.tmpdir)
-
-    def test_reception_a(self):
-        """Test that the connection receives what has been enqueued in the input file."""
-        msg = DefaultMessage(
-            dialogue_reference=("", ""),
-            message_id=1,
-            target=0,
-            performative=DefaultMessage.Performative.BYTES,
-            content=b"hello",
-        )
-        expected_envelope = Envelope(
-            to="any",
-            sender="any",
-            protocol_id=DefaultMessage.protocol_id,
-            message=DefaultSerializer().encode(msg),
-        )
-        encoded_envelope = "{}{}{}{}{}{}{}{}".format(
-            expected_envelope.to,
-            SEPARATOR,
-            expected_envelope.sender,
-            SEPARATOR,
-            expected_envelope.protocol_id,
-            SEPARATOR,
-            expected_envelope.message.decode("utf-8"),
-            SEPARATOR,
-        )
-        encoded_envelope = encoded_envelope.encode("utf-8")
-
-        with open(self.input_file_path, "ab+") as f:
-            f.write(encoded_envelope)
-            f.flush()
-
-        actual_envelope = self.multiplexer.get(block=True, timeout=3.0)
-        assert expected_envelope == actual_envelope
-
-    def test_reception_b(self):
-        """Test that the connection receives what has been enqueued in the input file."""
-        # a message containing delimiters and newline characters
-        msg = b"\x08\x02\x12\x011\x1a\x011 \x01:,\n*0x32468d\n,\nB8Ab795\n\n49B49C88DC991990E7910891,,dbd\n"
-        protocol_id = PublicId.from_str("some_author/some_name:0.1.0")
-        expected_envelope = Envelope(
-            to="any", sender="any", protocol_id=protocol_id, message=msg,
-        )
-        encoded_envelope = "{}{}{}{}{}{}{}{}".format(
-            expected_envelope.to,
-            SEPARATOR,
-            expected_envelope.sender,
-            SEPARATOR,
-            expected_envelope.protocol_id,
-            SEPARATOR,
-            expected_envelope.message.decode("utf-8"),
-            SEPARATOR,
-        )
-        encoded_envelope = encoded_envelope.encode("utf-8")
-
-        with open(self.input_file_path, "ab+") as f:
-            f.write(encoded_envelope)
-            f.flush()
-
-        actual_envelope = self.multiplexer.get(block=True, timeout=3.0)
-        assert expected_envelope == actual_envelope
-
-    def test_reception_c(self):
-        """Test that the connection receives what has been enqueued in the input file."""
-        encoded_envelope = b"0x5E22777dD831A459535AA4306AceC9cb22eC4cB5,default_oef,fetchai/oef_search:0.1.0,\x08\x02\x12\x011\x1a\x011 \x01:,\n*0x32468dB8Ab79549B49C88DC991990E7910891dbd,"
-        expected_envelope = Envelope(
-            to="0x5E22777dD831A459535AA4306AceC9cb22eC4cB5",
-            sender="default_oef",
-            protocol_id=PublicId.from_str("fetchai/oef_search:0.1.0"),
-            message=b"\x08\x02\x12\x011\x1a\x011 \x01:,\n*0x32468dB8Ab79549B49C88DC991990E7910891dbd",
-        )
-        with open(self.input_file_path, "ab+") as f:
-            f.write(encoded_envelope)
-            f.flush()
-
-        actual_envelope = self.multiplexer.get(block=True, timeout=3.0)
-        assert expected_envelope == actual_envelope
-
     def test_reception_fails(self):
         """Test the case when an error occurs during the processing of a line."""
         patch = mock.patch.object(aea.connections.stub.connection.logger, "error")
@@ -153,16 +87,6 @@ class TestStubConnectionReception:
 
         patch.stop()
 
-    @classmethod
-    def teardown_class(cls):
-        """Tear down the test."""
-        os.chdir(cls.cwd)
-        try:
-            shutil.rmtree(cls.tmpdir)
-        except (OSError, IOError):
-            pass
-        cls.multiplexer.disconnect()
-
 
 class TestStubConnectionSending:
     """Test that the stub connection is implemented correctly."""
@@ -170,7 +94,6 @@ class TestStubConnectionSending:
     @classmethod
     def setup_class(cls):
         """Set the test up."""
-        cls.cwd = os.getcwd()
         cls.tmpdir = Path(tempfile.mkdtemp())
         d = cls.tmpdir / "test_stub"
         d.mkdir(parents=True)
@@ -182,7 +105,6 @@ class TestStubConnectionSending:
 
         cls.multiplexer = Multiplexer([cls.connection])
         cls.multiplexer.connect()
-        os.chdir(cls.tmpdir)
 
     def test_connection_is_established(self):
         """Test the stub connection is established and then bad formatted messages."""
@@ -194,17 +116,9 @@ class TestStubConnectionSending:
             performative=DefaultMessage.Performative.BYTES,
             content=b"hello",
         )
-        encoded_envelope = "{}{}{}{}{}{}{}{}".format(
-            "any",
-            SEPARATOR,
-            "any",
-            SEPARATOR,
-            DefaultMessage.protocol_id,
-            SEPARATOR,
-            DefaultSerializer().encode(msg).decode("utf-8"),
-            SEPARATOR,
+        encoded_envelope = base64.b64encode(
+            DEFAULT_ENVELOPE_PREFIX + DEFAULT_SERIALIZER.encode(msg) + ENCODED_SEPARATOR
         )
-        encoded_envelope = base64.b64encode(encoded_envelope.encode("utf-8"))
         envelope = _process_line(encoded_envelope)
         if envelope is not None:
             self.connection._put_envelopes([envelope])
@@ -226,19 +140,18 @@ class TestStubConnectionSending:
             to="any",
             sender="any",
             protocol_id=DefaultMessage.protocol_id,
-            message=DefaultSerializer().encode(msg),
+            message=DEFAULT_SERIALIZER.encode(msg),
         )
 
         self.multiplexer.put(expected_envelope)
-        time.sleep(0.1)
+        wait_for_condition(lambda: self.output_file_path.stat().st_size > 0, timeout=5)
 
-        with open(self.output_file_path, "rb+") as f:
-            lines = f.readlines()
+        data = self.output_file_path.read_bytes()
 
-        assert len(lines) == 2
-        line = lines[0] + lines[1]
-        to, sender, protocol_id, message, end = line.strip().split(
-            "{}".format(SEPARATOR).encode("utf-8"), maxsplit=4
+        # the encoded message contains exactly one newline character
+        assert data.count(b"\n") == 1
+        to, sender, protocol_id, message, end = data.strip().split(
+            ENCODED_SEPARATOR, maxsplit=4
         )
         to = to.decode("utf-8")
         sender = sender.decode("utf-8")
@@ -253,7 +166,6 @@ class TestStubConnectionSending:
     @classmethod
     def teardown_class(cls):
         """Tear down the test."""
-        os.chdir(cls.cwd)
         try:
             shutil.rmtree(cls.tmpdir)
         except (OSError, IOError):
@@ -261,49 +173,96 @@ class TestStubConnectionSending:
         cls.multiplexer.disconnect()
 
 
+@pytest.fixture(scope="module")
+def event_loop():
+    """Run the asynchronous tests of this module on a single event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+async def stub_connection(tmp_path):
+    """Create a stub connection reading from and writing to a temporary directory."""
+    connection = _make_stub_connection(
+        tmp_path / "input_file.csv", tmp_path / "output_file.csv"
+    )
+    yield connection
+    await connection.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "to,sender,protocol_id,message",
+    [
+        (
+            "any",
+            "any",
+            DefaultMessage.protocol_id,
+            DEFAULT_SERIALIZER.encode(
+                DefaultMessage(
+                    dialogue_reference=("", ""),
+                    message_id=1,
+                    target=0,
+                    performative=DefaultMessage.Performative.BYTES,
+                    content=b"hello",
+                )
+            ),
+        ),
+        # a message containing delimiters and newline characters
+        (
+            "any",
+            "any",
+            PublicId.from_str("some_author/some_name:0.1.0"),
+            b"\x08\x02\x12\x011\x1a\x011 \x01:,\n*0x32468d\n,\nB8Ab795\n\n49B49C88DC991990E7910891,,dbd\n",
+        ),
+        (
+            "0x5E22777dD831A459535AA4306AceC9cb22eC4cB5",
+            "default_oef",
+            PublicId.from_str("fetchai/oef_search:0.1.0"),
+            b"\x08\x02\x12\x011\x1a\x011 \x01:,\n*0x32468dB8Ab79549B49C88DC991990E7910891dbd",
+        ),
+    ],
+)
+async def test_reception(stub_connection, tmp_path, to, sender, protocol_id, message):
+    """Test that the connection receives what has been enqueued in the input file."""
+    expected_envelope = Envelope(
+        to=to, sender=sender, protocol_id=protocol_id, message=message,
+    )
+    stub_connection.loop = asyncio.get_event_loop()
+    await stub_connection.connect()
+    _append_to_file(
+        tmp_path / "input_file.csv", _encode_envelope(to, sender, protocol_id, message)
+    )
+
+    actual_envelope = await asyncio.wait_for(stub_connection.receive(), timeout=3.0)
+    assert expected_envelope == actual_envelope
+
+
 @pytest.mark.asyncio
-async def test_disconnection_when_already_disconnected():
+async def test_disconnection_when_already_disconnected(stub_connection):
     """Test the case when disconnecting a connection already disconnected."""
-    tmpdir = Path(tempfile.mkdtemp())
-    d = tmpdir / "test_stub"
-    d.mkdir(parents=True)
-    input_file_path = d / "input_file.csv"
-    output_file_path = d / "output_file.csv"
-    connection = _make_stub_connection(input_file_path, output_file_path)
-
-    assert not connection.connection_status.is_connected
-    await connection.disconnect()
-    assert not connection.connection_status.is_connected
+    assert not stub_connection.connection_status.is_connected
+    await stub_connection.disconnect()
+    assert not stub_connection.connection_status.is_connected
 
 
 @pytest.mark.asyncio
-async def test_connection_when_already_connected():
+async def test_connection_when_already_connected(stub_connection):
     """Test the case when connecting a connection already connected."""
-    tmpdir = Path(tempfile.mkdtemp())
-    d = tmpdir / "test_stub"
-    d.mkdir(parents=True)
-    input_file_path = d / "input_file.csv"
-    output_file_path = d / "output_file.csv"
-    connection = _make_stub_connection(input_file_path, output_file_path)
-
-    assert not connection.connection_status.is_connected
-    await connection.connect()
-    assert connection.connection_status.is_connected
-    await connection.connect()
-    assert connection.connection_status.is_connected
+    assert not stub_connection.connection_status.is_connected
+    await stub_connection.connect()
+    assert stub_connection.connection_status.is_connected
+    await stub_connection.connect()
+    assert stub_connection.connection_status.is_connected
+    await stub_connection.disconnect()
+    assert not stub_connection.connection_status.is_connected
 
 
 @pytest.mark.asyncio
-async def test_receiving_returns_none_when_error_occurs():
+async def test_receiving_returns_none_when_error_occurs(stub_connection):
     """Test that when we try to receive an envelope and an error occurs we return None."""
-    tmpdir = Path(tempfile.mkdtemp())
-    d = tmpdir / "test_stub"
-    d.mkdir(parents=True)
-    input_file_path = d / "input_file.csv"
-    output_file_path = d / "output_file.csv"
-    connection = _make_stub_connection(input_file_path, output_file_path)
-
-    await connection.connect()
-    with mock.patch.object(connection.in_queue, "get", side_effect=Exception):
-        ret = await connection.receive()
+    await stub_connection.connect()
+    with mock.patch.object(stub_connection.in_queue, "get", side_effect=Exception):
+        ret = await stub_connection.receive()
         assert ret is None
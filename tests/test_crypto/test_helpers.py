@@ -124,12 +124,12 @@ class TestHelperFile:
             EthereumCrypto.identifier, ETHEREUM_PRIVATE_KEY_PATH
         )
 
-    @patch("builtins.open", mock_open())
+    @patch("aea.crypto.helpers.open", mock_open(), create=True)
     def test__create_ethereum_private_key_positive(self, *mocks):
         """Test _create_ethereum_private_key positive result."""
         create_private_key(EthereumCrypto.identifier)
 
-    @patch("builtins.open", mock_open())
+    @patch("aea.crypto.helpers.open", mock_open(), create=True)
     def test__create_cosmos_private_key_positive(self, *mocks):
         """Test _create_cosmos_private_key positive result."""
         create_private_key(CosmosCrypto.identifier)
@@ -31,6 +31,8 @@ from aea.helpers.search.models import (
 from packages.fetchai.protocols.oef_search.message import OefSearchMessage
 from packages.fetchai.protocols.oef_search.serialization import OefSearchSerializer
 
+OEF_SEARCH_SERIALIZER = OefSearchSerializer()
+
 
 def test_oef_serialization_description():
     """Testing the serialization of the OEF."""
@@ -41,9 +43,9 @@ def test_oef_serialization_description():
         dialogue_reference=(str(1), ""),
         service_description=desc,
     )
-    msg_bytes = OefSearchSerializer().encode(msg)
+    msg_bytes = OEF_SEARCH_SERIALIZER.encode(msg)
     assert len(msg_bytes) > 0
-    recovered_msg = OefSearchSerializer().decode(msg_bytes)
+    recovered_msg = OEF_SEARCH_SERIALIZER.decode(msg_bytes)
     assert recovered_msg == msg
 
 
@@ -55,7 +57,7 @@ def test_oef_serialization_query():
         dialogue_reference=(str(1), ""),
         query=query,
     )
-    msg_bytes = OefSearchSerializer().encode(msg)
+    msg_bytes = OEF_SEARCH_SERIALIZER.encode(msg)
     assert len(msg_bytes) > 0
-    recovered_msg = OefSearchSerializer().decode(msg_bytes)
+    recovered_msg = OEF_SEARCH_SERIALIZER.decode(msg_bytes)
     assert recovered_msg == msg
@@ -18,6 +18,7 @@
 # ------------------------------------------------------------------------------
 """This module contains the tests for the protocol generator."""
 import filecmp
+import importlib.util
 import inspect
 import logging
 import os
@@ -28,7 +29,7 @@ import tempfile
 import time
 from pathlib import Path
 from threading import Thread
-from typing import Optional
+from typing import Any, Dict, Optional
 from unittest import TestCase, mock
 
 import pytest
@@ -48,6 +49,7 @@ from aea.crypto.helpers import create_private_key
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
 from aea.protocols.generator import (
+    IndentWriter,
     ProtocolGenerator,
     _is_composition_type_with_custom_type,
     _specification_type_to_python_type,
@@ -72,6 +74,28 @@ logging.basicConfig(level=logging.INFO)
 CUR_PATH = os.path.dirname(inspect.getfile(inspect.currentframe()))  # type: ignore
 HOST = "127.0.0.1"
 PORT = 10000
+BUILTIN_CONTENT_NAMES_SPECIFICATION = """name: builtin_names
+author: fetchai
+version: 0.1.0
+license: Apache-2.0
+aea_version: '>=0.3.0, <0.4.0'
+description: 'A protocol whose content names shadow builtins.'
+speech_acts:
+  perform:
+    type: pt:list[pt:int]
+"""
+
+
+def _load_builtin_content_names_specification(directory: str) -> ProtocolSpecification:
+    """Write the specification of the builtin_names protocol to the directory and load it."""
+    path_to_specification = os.path.join(directory, "specification.yaml")
+    with open(path_to_specification, "w") as f:
+        f.write(BUILTIN_CONTENT_NAMES_SPECIFICATION)
+    config_loader = ConfigLoader(
+        "protocol-specification_schema.json", ProtocolSpecification
+    )
+    with open(path_to_specification) as f:
+        return config_loader.load_protocol_specification(f)
 
 
 class TestEndToEndGenerator(UseOef):
@@ -477,12 +501,224 @@ class SpecificationTypeToPythonTypeTestCase(TestCase):
             _specification_type_to_python_type("unsupported_type")
 
 
+class IndentWriterTestCase(TestCase):
+    """Test case for IndentWriter class."""
+
+    def test_write_indented_lines(self):
+        """Test lines are written at the current indentation level."""
+        writer = IndentWriter()
+        writer.write("class A:")
+        writer.indent()
+        writer.write('"""A class."""')
+        writer.write()
+        writer.write("def f(self):")
+        writer.indent()
+        writer.write("return 1")
+        writer.dedent(2)
+        writer.write_raw("# end")
+        self.assertEqual(
+            writer.getvalue(),
+            'class A:\n    """A class."""\n\n    def f(self):\n        return 1\n# end',
+        )
+
+    def test_dedent_below_zero(self):
+        """Test dedenting below level 0 raises an error."""
+        writer = IndentWriter()
+        writer.indent()
+        with self.assertRaises(ValueError):
+            writer.dedent(2)
+
+
+class GeneratedMessageConsistencyTestCase(TestCase):
+    """Test case for the _is_consistent method of a generated message."""
+
+    @staticmethod
+    def _pt_message(**kwargs) -> TProtocolMessage:
+        """Create a 'performative_pt' message, with the given contents overriding valid ones."""
+        contents = dict(
+            content_bytes=b"some bytes",
+            content_int=42,
+            content_float=42.7,
+            content_bool=True,
+            content_str="some string",
+        )  # type: Dict[str, Any]
+        contents.update(kwargs)
+        return TProtocolMessage(
+            performative=TProtocolMessage.Performative.PERFORMATIVE_PT, **contents
+        )
+
+    def test_is_consistent_positive(self):
+        """Test a message with the expected contents is consistent."""
+        self.assertTrue(self._pt_message()._is_consistent())
+        message = TProtocolMessage(
+            performative=TProtocolMessage.Performative.PERFORMATIVE_O,
+            content_o_bool=True,
+        )
+        self.assertTrue(message._is_consistent())
+
+    def test_is_consistent_wrong_content_type(self):
+        """Test a message with a content of the wrong type is not consistent."""
+        self.assertFalse(self._pt_message(content_int="42")._is_consistent())
+        self.assertFalse(self._pt_message(content_int=True)._is_consistent())
+        message = TProtocolMessage(
+            performative=TProtocolMessage.Performative.PERFORMATIVE_O, content_o_bool=1,
+        )
+        self.assertFalse(message._is_consistent())
+
+    def test_is_consistent_wrong_number_of_contents(self):
+        """Test a message with a missing or an extra content is not consistent."""
+        message = self._pt_message()
+        message.unset("content_str")
+        self.assertFalse(message._is_consistent())
+        message = self._pt_message(content_set_int=frozenset([1]))
+        self.assertFalse(message._is_consistent())
+
+    def test_content_accessors(self):
+        """Test the content properties only require the content to be set."""
+        message = self._pt_message(content_str=None)
+        self.assertIsNone(message.content_str)
+        message.unset("content_str")
+        with self.assertRaises(AssertionError):
+            message.content_str
+
+    def test_is_consistent_invalid_performative(self):
+        """Test a message with an invalid performative is logged and not consistent."""
+        message = self._pt_message()
+        message.set("performative", "invalid_performative")
+        with mock.patch(
+            "tests.data.generator.t_protocol.message.logger.error"
+        ) as logger_error_mock:
+            self.assertFalse(message._is_consistent())
+        logger_error_mock.assert_called_once()
+
+
+class GeneratedMessageContentNamesTestCase(TestCase):
+    """Test case for the generated message of a protocol whose content names shadow builtins."""
+
+    def setUp(self):
+        """Generate the protocol and import its message module."""
+        self.t = tempfile.mkdtemp()
+        protocol_specification = _load_builtin_content_names_specification(self.t)
+        with mock.patch(
+            "aea.protocols.generator.subprocess.Popen",
+            **{"return_value.wait.return_value": 0},
+        ):
+            ProtocolGenerator(protocol_specification, self.t).generate()
+
+        module_spec = importlib.util.spec_from_file_location(
+            "builtin_names_message",
+            os.path.join(self.t, protocol_specification.name, "message.py"),
+        )
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)  # type: ignore
+        self.message_class = module.BuiltinNamesMessage
+
+    def test_is_consistent_with_content_named_type(self):
+        """Test a content named 'type' does not break the generated checks."""
+        message = self.message_class(
+            performative=self.message_class.Performative.PERFORM, type=(1, 2),
+        )
+        self.assertTrue(message._is_consistent())
+
+        message = self.message_class(
+            performative=self.message_class.Performative.PERFORM, type=("1", "2"),
+        )
+        self.assertFalse(message._is_consistent())
+
+    def tearDown(self):
+        """Tear the test down."""
+        shutil.rmtree(self.t, ignore_errors=True)
+
+
+class GenerateProtocTestCase(TestCase):
+    """Test case for the compilation of the protobuf schema in ProtocolGenerator.generate."""
+
+    def setUp(self):
+        """Set the test up."""
+        self.t = tempfile.mkdtemp()
+        protocol_specification = _load_builtin_content_names_specification(self.t)
+        self.protocol_generator = ProtocolGenerator(protocol_specification, self.t)
+        self.protocol_folder = os.path.join(self.t, protocol_specification.name)
+
+    @mock.patch("aea.protocols.generator.logger.error")
+    @mock.patch(
+        "aea.protocols.generator.subprocess.Popen", side_effect=FileNotFoundError
+    )
+    def test_generate_protoc_not_found(self, popen_mock, logger_error_mock):
+        """Test the protocol modules are generated when protoc is not installed."""
+        self.protocol_generator.generate()
+        logger_error_mock.assert_called_once()
+        for file_name in [
+            "__init__.py",
+            "protocol.yaml",
+            "message.py",
+            "serialization.py",
+            "builtin_names.proto",
+        ]:
+            self.assertTrue(
+                os.path.isfile(os.path.join(self.protocol_folder, file_name))
+            )
+
+    @mock.patch("aea.protocols.generator.subprocess.Popen")
+    def test_generate_protoc_positive(self, popen_mock):
+        """Test the protobuf schema is compiled with protoc."""
+        popen_mock.return_value.wait.return_value = 0
+        self.protocol_generator.generate()
+        popen_mock.assert_called_once()
+        self.assertEqual(popen_mock.call_args[0][0][0], "protoc")
+        popen_mock.return_value.wait.assert_called_once()
+
+    @mock.patch("aea.protocols.generator.subprocess.Popen")
+    def test_generate_protoc_failure(self, popen_mock):
+        """Test a failing protoc raises once the protocol modules are generated."""
+        popen_mock.return_value.wait.return_value = 1
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.protocol_generator.generate()
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.protocol_folder, "serialization.py"))
+        )
+
+    @mock.patch("aea.protocols.generator.subprocess.Popen")
+    def test_generate_recompiles_after_protoc_failure(self, popen_mock):
+        """Test an unchanged schema is compiled again after protoc failed."""
+        # a compiled module left over from a former schema
+        os.mkdir(self.protocol_folder)
+        Path(self.protocol_folder, "builtin_names_pb2.py").touch()
+        popen_mock.return_value.wait.return_value = 1
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.protocol_generator.generate()
+        popen_mock.return_value.wait.return_value = 0
+        self.protocol_generator.generate()
+        self.assertEqual(popen_mock.call_count, 2)
+
+    @mock.patch("aea.protocols.generator.subprocess.Popen")
+    def test_generate_waits_for_protoc_on_error(self, popen_mock):
+        """Test protoc is waited on when generating a module fails."""
+        popen_mock.return_value.wait.return_value = 0
+        with mock.patch.object(
+            self.protocol_generator,
+            "_write_serialization_module",
+            side_effect=ValueError,
+        ):
+            with self.assertRaises(ValueError):
+                self.protocol_generator.generate()
+        popen_mock.return_value.wait.assert_called_once()
+
+    def tearDown(self):
+        """Tear the test down."""
+        shutil.rmtree(self.t, ignore_errors=True)
+
+
 @mock.patch(
     "aea.protocols.generator._get_sub_types_of_compositional_types", return_value=[1, 2]
 )
 class UnionSubTypeToProtobufVariableNameTestCase(TestCase):
     """Test case for _union_sub_type_to_protobuf_variable_name method."""
 
+    def setUp(self):
+        """Clear the cached results, so that the mocked helper is called."""
+        _union_sub_type_to_protobuf_variable_name.cache_clear()
+
     def test__union_sub_type_to_protobuf_variable_name_tuple(self, mock):
         """Test _union_sub_type_to_protobuf_variable_name method tuple."""
         _union_sub_type_to_protobuf_variable_name("content_name", "Tuple")
@@ -35,7 +35,6 @@ from aea.registries.resources import Resources
 from aea.skills.base import SkillContext
 from aea.skills.error.handlers import ErrorHandler
 
-from packages.fetchai.connections.local.connection import LocalNode
 from packages.fetchai.protocols.fipa.message import FipaMessage
 from packages.fetchai.protocols.fipa.serialization import FipaSerializer
 
@@ -43,6 +42,9 @@ from tests.common.utils import wait_for_condition
 
 from ..conftest import CUR_PATH, _make_dummy_connection
 
+DEFAULT_SERIALIZER = DefaultSerializer()
+FIPA_SERIALIZER = FipaSerializer()
+
 
 class InboxWithHistory(InBox):
     """Inbox with history of all messages every fetched."""
@@ -62,10 +64,21 @@ class InboxWithHistory(InBox):
 class TestSkillError:
     """Test the skill: Error."""
 
+    @classmethod
+    def setup_class(cls):
+        """Set up the payload shared by the tests."""
+        cls.fipa_msg_bytes = FIPA_SERIALIZER.encode(
+            FipaMessage(
+                message_id=1,
+                dialogue_reference=(str(0), ""),
+                target=0,
+                performative=FipaMessage.Performative.ACCEPT,
+            )
+        )
+
     def setup(self):
         """Test the initialisation of the AEA."""
         cls = self
-        cls.node = LocalNode()
         private_key_path = os.path.join(CUR_PATH, "data", "fet_private_key.txt")
         cls.wallet = Wallet({FetchAICrypto.identifier: private_key_path})
         cls.ledger_apis = LedgerApis({}, FetchAICrypto.identifier)
@@ -114,67 +127,46 @@ class TestSkillError:
     def test_error_skill_unsupported_protocol(self):
         """Test the unsupported error message."""
         self.my_aea._inbox._history = []
-        msg = FipaMessage(
-            message_id=1,
-            dialogue_reference=(str(0), ""),
-            target=0,
-            performative=FipaMessage.Performative.ACCEPT,
-        )
-        msg_bytes = FipaSerializer().encode(msg)
         envelope = Envelope(
             to=self.address,
             sender=self.address,
             protocol_id=FipaMessage.protocol_id,
-            message=msg_bytes,
+            message=self.fipa_msg_bytes,
         )
 
         self.my_error_handler.send_unsupported_protocol(envelope)
 
         wait_for_condition(lambda: len(self.my_aea._inbox._history) >= 1, timeout=5)
         envelope = self.my_aea._inbox._history[-1]
-        msg = DefaultSerializer().decode(envelope.message)
+        msg = DEFAULT_SERIALIZER.decode(envelope.message)
         assert msg.performative == DefaultMessage.Performative.ERROR
         assert msg.error_code == DefaultMessage.ErrorCode.UNSUPPORTED_PROTOCOL
 
     def test_error_decoding_error(self):
         """Test the decoding error."""
         self.my_aea._inbox._history = []
-        msg = FipaMessage(
-            message_id=1,
-            dialogue_reference=(str(0), ""),
-            target=0,
-            performative=FipaMessage.Performative.ACCEPT,
-        )
-        msg_bytes = FipaSerializer().encode(msg)
         envelope = Envelope(
             to=self.address,
             sender=self.address,
             protocol_id=DefaultMessage.protocol_id,
-            message=msg_bytes,
+            message=self.fipa_msg_bytes,
         )
 
         self.my_error_handler.send_decoding_error(envelope)
         wait_for_condition(lambda: len(self.my_aea._inbox._history) >= 1, timeout=5)
         envelope = self.my_aea._inbox._history[-1]
 
-        msg = DefaultSerializer().decode(envelope.message)
+        msg = DEFAULT_SERIALIZER.decode(envelope.message)
         assert msg.performative == DefaultMessage.Performative.ERROR
         assert msg.error_code == DefaultMessage.ErrorCode.DECODING_ERROR
 
     def test_error_unsupported_skill(self):
         """Test the unsupported skill."""
-        msg = FipaMessage(
-            message_id=1,
-            dialogue_reference=(str(0), ""),
-            target=0,
-            performative=FipaMessage.Performative.ACCEPT,
-        )
-        msg_bytes = FipaSerializer().encode(msg)
         envelope = Envelope(
             to=self.address,
             sender=self.address,
             protocol_id=DefaultMessage.protocol_id,
-            message=msg_bytes,
+            message=self.fipa_msg_bytes,
         )
 
         self.my_error_handler.send_unsupported_skill(envelope=envelope)
@@ -182,7 +174,7 @@ class TestSkillError:
         wait_for_condition(lambda: len(self.my_aea._inbox._history) >= 1, timeout=5)
         envelope = self.my_aea._inbox._history[-1]
 
-        msg = DefaultSerializer().decode(envelope.message)
+        msg = DEFAULT_SERIALIZER.decode(envelope.message)
         assert msg.performative == DefaultMessage.Performative.ERROR
         assert msg.error_code == DefaultMessage.ErrorCode.UNSUPPORTED_SKILL
 